@@ -1,8 +1,13 @@
 """Main CLI entry point for asma."""
+from typing import TYPE_CHECKING
+
 import click
 from pathlib import Path
 from asma import __version__
 
+if TYPE_CHECKING:
+    from asma.models.skill import SkillScope
+
 
 SKILLSET_TEMPLATE = """# Agent Skills Manager Configuration
 # See: https://github.com/hawkymisc/asma
@@ -29,6 +34,15 @@ project:
 """
 
 
+def _install_base(scope: "SkillScope") -> Path:
+    """Directory skills of the given scope are installed into."""
+    from asma.models.skill import SkillScope
+
+    if scope == SkillScope.GLOBAL:
+        return Path.home() / ".claude/skills"
+    return Path.cwd() / ".claude/skills"
+
+
 @click.group()
 @click.version_option(version=__version__)
 def cli() -> None:
@@ -351,7 +365,6 @@ def install(skillset_file: str, scope: str, force: bool, strict: bool) -> None:
     from asma.core.sources.base import SourceHandler
     from asma.core.sources.local import LocalSourceHandler
     from asma.core.sources.github import GitHubSourceHandler
-    from asma.models.skill import SkillScope
     from asma.models.lock import Lockfile, LockEntry
 
     skillset_path = Path(skillset_file)
@@ -390,6 +403,28 @@ def install(skillset_file: str, scope: str, force: bool, strict: bool) -> None:
     lock_path = skillset_path.parent / "skillset.lock"
     lockfile = Lockfile.load(lock_path)
 
+    # Bail out early if the GitHub API quota cannot cover the whole batch.
+    # Skills that are already installed or served from the download cache
+    # make no requests, so only the rest are counted.
+    github_skills = [
+        s for s in skills_to_install
+        if s.source.startswith("github:")
+        and (force or not (_install_base(s.scope) / s.install_name).exists())
+    ]
+    if github_skills:
+        preflight_handler = GitHubSourceHandler(token=os.environ.get("GITHUB_TOKEN"))
+        try:
+            n_needed = sum(preflight_handler.network_requests_needed(s) for s in github_skills)
+            if n_needed:
+                preflight_handler.preflight(n_needed)
+        except PermissionError as e:
+            click.echo(click.style("Error: ", fg="red", bold=True) + str(e))
+            raise click.Abort() from None
+        except (ConnectionError, FileNotFoundError, ValueError):
+            # Quota unknown (e.g. no /rate_limit on GitHub Enterprise or behind
+            # a proxy); let each install report its own errors
+            pass
+
     # Install skills
     installer = SkillInstaller()
     success_count = 0
@@ -398,11 +433,7 @@ def install(skillset_file: str, scope: str, force: bool, strict: bool) -> None:
     click.echo(f"Installing {len(skills_to_install)} skill(s)...")
 
     for skill in skills_to_install:
-        # Determine install base
-        if skill.scope == SkillScope.GLOBAL:
-            install_base = Path.home() / ".claude/skills"
-        else:
-            install_base = Path.cwd() / ".claude/skills"
+        install_base = _install_base(skill.scope)
 
         # Get source handler
         # strict mode: CLI --strict flag OR skillset.yaml config.strict
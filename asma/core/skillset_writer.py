@@ -1,14 +1,295 @@
 """Skillset.yaml writer for adding and updating skills."""
+import contextlib
+import hashlib
+import math
+import os
+import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from types import ModuleType
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
 
 from asma.models.skill import SkillScope
 
-
-@dataclass
+# Optional fast JSON codec for the parsed-skillset sidecar cache
+_orjson: Optional[ModuleType]
+try:
+    import orjson
+
+    _orjson = orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    _orjson = None
+
+# Write buffer for skillset.yaml; large enough that a dump is a single write
+_WRITE_BUFFER_SIZE = 65536
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+# Emitter line width that never wraps; libyaml rejects float("inf")
+_NO_WRAP_WIDTH = 2**31 - 1
+
+# Scalars the fast YAML path reads and writes unquoted. Starting with a letter
+# rules out numbers, nulls and indicator characters; the character set rules
+# out whitespace, quotes, comments and flow syntax. Anything else goes through
+# PyYAML.
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z][A-Za-z0-9_./~@+:-]*")
+_FAST_LINE_RE = re.compile(
+    r"(?P<indent> *)(?P<dash>- )?(?P<key>[A-Za-z][A-Za-z0-9_./~@+-]*):(?: (?P<value>\S.*))?"
+)
+# The next top-level key after a section, and entry lines inside one
+_TOP_LEVEL_LINE_RE = re.compile(r"^[^ \n#]", re.MULTILINE)
+_CHILD_LINE_RE = re.compile(r"^( *)[^ \n#]", re.MULTILINE)
+# Words YAML 1.1 resolves to booleans or null rather than strings
+_RESERVED_SCALARS = frozenset({
+    "y", "n", "yes", "no", "true", "false", "on", "off", "null",
+})
+
+
+# PyYAML is imported on first use: most skillset files never leave the fast
+# path, and commands that only construct a writer should not pay for it.
+
+
+def _yaml_load(raw: bytes) -> Any:
+    """Parse a YAML document with PyYAML's fastest safe loader."""
+    import yaml
+
+    return yaml.load(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _yaml_dump(data: Dict[str, Any], stream: IO[str]) -> None:
+    """Write data as block-style YAML with PyYAML's fastest safe dumper."""
+    import yaml
+
+    yaml.dump(
+        data,
+        stream,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+        width=_NO_WRAP_WIDTH
+    )
+
+
+def _default_cache_dir() -> Path:
+    """Default parse cache directory under the current user's home."""
+    return Path.home() / ".cache" / "asma" / "skillsets"
+
+
+def _is_plain(value: Any) -> bool:
+    """Check whether a value is a string YAML reads back unchanged when unquoted."""
+    return (
+        isinstance(value, str)
+        and _PLAIN_SCALAR_RE.fullmatch(value) is not None
+        and not value.endswith(":")
+        and value.lower() not in _RESERVED_SCALARS
+    )
+
+
+def _fast_dump(data: Dict[str, Any]) -> Optional[str]:
+    """
+    Serialize skillset data without PyYAML when it only holds plain strings.
+
+    The output is byte-for-byte what ``yaml.safe_dump(data,
+    default_flow_style=False, sort_keys=False)`` produces for the same data.
+
+    Args:
+        data: Skillset data with top-level sections
+
+    Returns:
+        YAML text, or None if the data needs the full PyYAML emitter
+    """
+    lines: List[str] = []
+    for key, section in data.items():
+        if not _is_plain(key):
+            return None
+        if section is None:
+            lines.append(f"{key}: null")
+        elif isinstance(section, dict):
+            if not section:
+                lines.append(f"{key}: {{}}")
+                continue
+            lines.append(f"{key}:")
+            for name, entry in section.items():
+                if not _is_plain(name):
+                    return None
+                if _is_plain(entry):
+                    lines.append(f"  {name}: {entry}")
+                elif isinstance(entry, dict):
+                    if not entry:
+                        lines.append(f"  {name}: {{}}")
+                        continue
+                    lines.append(f"  {name}:")
+                    for field, value in entry.items():
+                        if not (_is_plain(field) and _is_plain(value)):
+                            return None
+                        lines.append(f"    {field}: {value}")
+                else:
+                    return None
+        elif isinstance(section, list):
+            if not section:
+                lines.append(f"{key}: []")
+                continue
+            lines.append(f"{key}:")
+            for item in section:
+                if not isinstance(item, dict) or not item:
+                    return None
+                prefix = "- "
+                for field, value in item.items():
+                    if not (_is_plain(field) and _is_plain(value)):
+                        return None
+                    lines.append(f"{prefix}{field}: {value}")
+                    prefix = "  "
+        else:
+            return None
+
+    return "\n".join(lines) + "\n" if lines else None
+
+
+def _fast_load(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse skillset YAML without PyYAML when it uses only the simple block layout.
+
+    Accepts the layout ``_fast_dump`` writes (two-space indentation, indentless
+    lists, plain string scalars) plus blank lines and full-line comments.
+
+    Args:
+        text: YAML document text
+
+    Returns:
+        Parsed data, or None if the document needs the full PyYAML parser
+    """
+    if "\t" in text or "\r" in text:
+        return None
+
+    data: Dict[str, Any] = {}
+    top_key: Optional[str] = None
+    open_name: Optional[str] = None
+    item: Optional[Dict[str, Any]] = None
+
+    for line in text.split("\n"):
+        stripped = line.lstrip()
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        match = _FAST_LINE_RE.fullmatch(line)
+        if match is None:
+            return None
+        indent = len(match.group("indent"))
+        key = match.group("key")
+        if not _is_plain(key):
+            # Keys like "no" or "null" load as booleans and None
+            return None
+        raw = match.group("value")
+        if raw is None or raw == "null":
+            value: Any = None
+        elif raw == "{}":
+            value = {}
+        elif raw == "[]":
+            value = []
+        elif _is_plain(raw):
+            value = raw
+        else:
+            return None
+
+        if match.group("dash"):
+            # "- key: value" starts a list item under the current section
+            if indent != 0 or top_key is None or not isinstance(value, str):
+                return None
+            section = data[top_key]
+            if section is None:
+                section = data[top_key] = []
+            elif not isinstance(section, list) or item is None:
+                return None
+            item = {key: value}
+            section.append(item)
+        elif indent == 0:
+            data[key] = value
+            top_key = key if raw is None else None
+            open_name = None
+            item = None
+        elif indent == 2:
+            if top_key is None:
+                return None
+            section = data[top_key]
+            if isinstance(section, list):
+                # Continuation of the current list item
+                if not isinstance(value, str) or item is None:
+                    return None
+                item[key] = value
+                continue
+            if section is None:
+                section = data[top_key] = {}
+            section[key] = value
+            open_name = key if raw is None else None
+        elif indent == 4:
+            if top_key is None or open_name is None:
+                return None
+            section = data[top_key]
+            if not isinstance(value, str):
+                return None
+            entry = section[open_name]
+            if entry is None:
+                entry = section[open_name] = {}
+            entry[key] = value
+        else:
+            return None
+
+    return data
+
+
+def _json_safe(value: Any) -> bool:
+    """Check whether a parsed YAML value survives a JSON round trip unchanged."""
+    if value is None or isinstance(value, (str, int)):
+        return True
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, list):
+        return all(_json_safe(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _json_safe(v) for k, v in value.items())
+    return False
+
+
+def _copy_sections(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy skillset data down to its sections, sharing the skill entries.
+
+    Args:
+        data: Skillset data with top-level sections
+
+    Returns:
+        New mapping whose dict and list sections are new containers
+    """
+    return {
+        key: dict(section) if isinstance(section, dict)
+        else list(section) if isinstance(section, list)
+        else section
+        for key, section in data.items()
+    }
+
+
+def _index_section(section: Any) -> Dict[str, int]:
+    """
+    Map skill names in a skillset section to their position.
+
+    Args:
+        section: Section value in either dict or list format
+
+    Returns:
+        Dict of skill name to index; empty for missing or malformed sections
+    """
+    if isinstance(section, dict):
+        return {name: i for i, name in enumerate(section)}
+    if isinstance(section, list):
+        return {
+            s["name"]: i for i, s in enumerate(section)
+            if isinstance(s, dict) and isinstance(s.get("name"), str)
+        }
+    return {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SkillEntry:
     """Skill entry to add to skillset.yaml."""
 
@@ -21,36 +302,205 @@ class SkillEntry:
 class SkillsetWriter:
     """Writer for skillset.yaml files."""
 
-    def __init__(self, skillset_path: Path):
+    def __init__(self, skillset_path: Path, cache_dir: Optional[Path] = None):
         """
         Initialize skillset writer.
 
         Args:
             skillset_path: Path to skillset.yaml file
+            cache_dir: Directory for the parsed-skillset cache
+                (default: ~/.cache/asma/skillsets)
         """
         self.skillset_path = skillset_path
+        self.cache_dir = cache_dir if cache_dir is not None else _default_cache_dir()
+        # (st_mtime_ns, st_size) of the file and the data parsed from it
+        self._cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        # Skill name -> position per scope, derived from the cached parse
+        self._name_index: Optional[Dict[str, Dict[str, int]]] = None
+        # Data being modified inside batch(), written once on exit
+        self._pending: Optional[Dict[str, Any]] = None
+
+    def _stat_key(self) -> Optional[Tuple[int, int]]:
+        """Return the cache key for the file on disk, or None if it is missing."""
+        try:
+            st = self.skillset_path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _invalidate(self) -> None:
+        """Drop the cached parse so the next load_raw re-reads the file."""
+        self._cache = None
+        self._name_index = None
+        try:
+            self._sidecar_path()[1].unlink()
+        except OSError:
+            pass
+
+    def _remember(self, data: Dict[str, Any]) -> None:
+        """Cache data just written so the next load_raw skips the parse."""
+        key = self._stat_key()
+        if key is None or not isinstance(data, dict):
+            self._invalidate()
+            return
+        cached = _copy_sections(data)
+        cached.setdefault("global", {})
+        cached.setdefault("project", {})
+        self._cache = (key, cached)
+        self._name_index = None
+        self._write_sidecar(key, cached)
+
+    def _parse(self) -> Dict[str, Any]:
+        """Parse skillset.yaml from disk, ensuring both scope sections exist."""
+        with self.skillset_path.open("rb") as f:
+            raw = f.read()
+        try:
+            data = _fast_load(raw.decode("utf-8"))
+        except UnicodeDecodeError:
+            data = None
+        if data is None:
+            # PyYAML detects the encoding itself when given bytes
+            data = _yaml_load(raw) or {}
 
-    def load_raw(self) -> Dict[str, Any]:
+        # Ensure sections exist
+        if "global" not in data:
+            data["global"] = {}
+        if "project" not in data:
+            data["project"] = {}
+
+        return data
+
+    def _sidecar_path(self) -> Tuple[str, Path]:
+        """Return the resolved skillset path and the JSON copy of its last parse."""
+        resolved = os.path.realpath(self.skillset_path)
+        digest = hashlib.sha256(resolved.encode()).hexdigest()[:16]
+        return resolved, self.cache_dir / f"{digest}.json"
+
+    def _read_sidecar(self, key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
         """
-        Load raw YAML data from skillset.yaml.
+        Load parsed data saved by an earlier process, if it matches the file on disk.
+
+        Args:
+            key: Current (st_mtime_ns, st_size) of skillset.yaml
 
         Returns:
-            Dict containing raw YAML data with global and project sections
+            Parsed data, or None if there is no usable sidecar
         """
-        if not self.skillset_path.exists():
-            return {"global": {}, "project": {}}
+        if _orjson is None:
+            return None
+        resolved, sidecar = self._sidecar_path()
+        try:
+            cached = _orjson.loads(sidecar.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(cached, dict)
+            or cached.get("path") != resolved
+            or cached.get("key") != list(key)
+        ):
+            return None
+        data = cached.get("data")
+        return data if isinstance(data, dict) else None
+
+    def _write_sidecar(self, key: Tuple[int, int], data: Dict[str, Any]) -> None:
+        """
+        Save parsed data in the cache directory so other processes can skip parsing.
 
-        with open(self.skillset_path) as f:
-            data = yaml.safe_load(f) or {}
+        Best effort: nothing is written without orjson, for data JSON cannot
+        represent exactly, or when the cache directory is not writable.
 
-        # Ensure sections exist
-        if "global" not in data:
-            data["global"] = {}
-        if "project" not in data:
-            data["project"] = {}
+        Args:
+            key: (st_mtime_ns, st_size) of the skillset.yaml the data came from
+            data: Parsed skillset data
+        """
+        if _orjson is None or not _json_safe(data):
+            return
+        resolved, sidecar = self._sidecar_path()
+        try:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            sidecar.write_bytes(_orjson.dumps({"path": resolved, "key": key, "data": data}))
+        except (OSError, TypeError):
+            # TypeError covers orjson.JSONEncodeError, e.g. for integers over 64 bits
+            pass
+
+    def _load(self) -> Dict[str, Any]:
+        """Return the parsed file, reusing the cache while the file is unchanged."""
+        key = self._stat_key()
+        if key is None:
+            self._cache = None
+            self._name_index = None
+            return {"global": {}, "project": {}}
+        if self._cache is not None and self._cache[0] == key:
+            return self._cache[1]
+
+        # Reads never write the sidecar; only save() refreshes it
+        data = self._read_sidecar(key)
+        if data is None:
+            data = self._parse()
 
+        self._cache = (key, data)
+        self._name_index = None
         return data
 
+    def _current(self) -> Dict[str, Any]:
+        """Return the data being edited in a batch, or else the parsed file."""
+        if self._pending is not None:
+            return self._pending
+        return self._load()
+
+    def _names(self, scope: SkillScope) -> Dict[str, int]:
+        """Return a name to position map for a scope's skills, built once per parse."""
+        data = self._current()
+        index = self._name_index
+        if index is None:
+            index = {
+                section_key: _index_section(data.get(section_key))
+                for section_key in ("global", "project")
+            }
+            if self._pending is not None or self._cache is not None:
+                self._name_index = index
+        return index[scope]
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["SkillsetWriter"]:
+        """
+        Group several add_skill calls into a single read and write of skillset.yaml.
+
+        Changes made inside the block are visible to skill_exists and load_raw
+        straight away and are written when the block exits. Nothing is written
+        if the block raises. Nested batches join the outermost one.
+
+        Yields:
+            This writer
+        """
+        if self._pending is not None:
+            yield self
+            return
+
+        self._pending = self.load_raw()
+        self._name_index = None
+        try:
+            yield self
+            pending = self._pending
+        finally:
+            self._pending = None
+            self._name_index = None
+        self.save(pending)
+
+    def load_raw(self) -> Dict[str, Any]:
+        """
+        Load raw YAML data from skillset.yaml.
+
+        The top-level mapping and its sections are private to the caller, but
+        individual skill entries are shared with the cache and must be
+        replaced rather than modified in place.
+
+        Returns:
+            Dict containing raw YAML data with global and project sections
+        """
+        # Callers add and replace skills before saving, so hand out fresh sections
+        return _copy_sections(self._current())
+
     def skill_exists(self, name: str, scope: SkillScope) -> bool:
         """
         Check if a skill already exists in the skillset.
@@ -62,21 +512,7 @@ class SkillsetWriter:
         Returns:
             True if skill exists, False otherwise
         """
-        data = self.load_raw()
-        section = data.get(scope.value, {})
-
-        if section is None:
-            return False
-
-        # Handle both list and dict formats
-        if isinstance(section, list):
-            return any(
-                s.get("name") == name for s in section if isinstance(s, dict)
-            )
-        elif isinstance(section, dict):
-            return name in section
-
-        return False
+        return name in self._names(scope)
 
     def add_skill(
         self,
@@ -95,20 +531,7 @@ class SkillsetWriter:
         Raises:
             ValueError: If skill exists and force=False
         """
-        data = self.load_raw()
-        section_key = scope.value
-
-        # Check if skill exists (inline to avoid re-reading file)
-        section = data.get(section_key)
-        exists = False
-        if isinstance(section, list):
-            exists = any(
-                s.get("name") == entry.name for s in section if isinstance(s, dict)
-            )
-        elif isinstance(section, dict):
-            exists = entry.name in section
-
-        if exists and not force:
+        if not force and self.skill_exists(entry.name, scope):
             raise ValueError(
                 f"Skill '{entry.name}' already exists in {scope.value} scope. "
                 f"Use --force to overwrite."
@@ -122,7 +545,20 @@ class SkillsetWriter:
             skill_data["ref"] = entry.ref
 
         # Handle different section formats
-        section = data.get(section_key)
+        data = self._pending if self._pending is not None else self.load_raw()
+        # SkillScope is a str enum, so it indexes the "global"/"project" keys directly
+        section = data.get(scope)
+
+        if (
+            self._pending is None
+            and isinstance(section, dict)
+            and entry.name not in section
+            and self._append_block(scope.value, entry.name, skill_data)
+        ):
+            # The file was edited in place; bring the cache up to date
+            section[entry.name] = skill_data
+            self._remember(data)
+            return
 
         if section is None:
             # Initialize as dict
@@ -141,10 +577,85 @@ class SkillsetWriter:
             # Initialize as dict if invalid type
             section = {entry.name: skill_data}
 
-        data[section_key] = section
+        data[scope.value] = section
+
+        if self._pending is None:
+            # Write back to file
+            self.save(data)
+            return
+
+        # Keep the batch's name index in step with the edit
+        index = self._name_index
+        if index is not None:
+            if isinstance(section, list):
+                index[scope.value] = _index_section(section)
+            else:
+                names = index[scope]
+                names.setdefault(entry.name, len(names))
+
+    def _append_block(self, section_key: str, name: str, skill_data: Dict[str, Any]) -> bool:
+        """
+        Append a new skill to a dict-format section by splicing text into the file.
+
+        The rest of the file, including comments and formatting outside the
+        inserted lines, is left byte-for-byte as it was. Only the simple
+        layouts written by save() are edited this way; for anything else the
+        file is left alone and the caller falls back to a full rewrite.
 
-        # Write back to file
-        self.save(data)
+        Args:
+            section_key: Top-level section to add to ("global" or "project")
+            name: Skill name, not yet present in the section
+            skill_data: Fields for the new skill
+
+        Returns:
+            True if the file was updated, False if it was not touched
+        """
+        fragment = _fast_dump({section_key: {name: skill_data}})
+        if fragment is None or self._cache is None or self._stat_key() != self._cache[0]:
+            return False
+        try:
+            text = self.skillset_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return False
+        if "\r" in text:
+            return False
+
+        # The section header must be the only top-level line for this key
+        header = f"{section_key}:"
+        starts = [m.start() for m in re.finditer(f"^{re.escape(header)}", text, re.MULTILINE)]
+        if len(starts) != 1:
+            return False
+        start = starts[0]
+        eol = text.find("\n", start)
+        if eol == -1:
+            eol = len(text)
+        header_line = text[start:eol]
+
+        # Drop the "global:" line; the body is the indented entry lines
+        body = fragment[len(header) + 1:].rstrip("\n")
+        if header_line == f"{header} {{}}":
+            new_text = f"{text[:start]}{header}\n{body}{text[eol:]}"
+        elif header_line == header:
+            block_start = eol + 1
+            next_top = _TOP_LEVEL_LINE_RE.search(text, block_start)
+            block_end = next_top.start() if next_top else len(text)
+            block = text[block_start:block_end]
+            children = list(_CHILD_LINE_RE.finditer(block))
+            # Block scalars may keep trailing blank lines; leave those files alone
+            if not children or children[0].group(1) != "  " or "|" in block or ">" in block:
+                return False
+            # Insert after the last entry line, ahead of trailing blanks and comments
+            line_end = block.find("\n", children[-1].start())
+            insert_at = block_start + (line_end if line_end != -1 else len(block))
+            new_text = f"{text[:insert_at]}\n{body}{text[insert_at:]}"
+        else:
+            return False
+
+        if not new_text.endswith("\n"):
+            new_text += "\n"
+        with self.skillset_path.open("w", encoding="utf-8") as f:
+            f.write(new_text)
+        return True
 
     def save(self, data: Dict[str, Any]) -> None:
         """
@@ -153,11 +664,11 @@ class SkillsetWriter:
         Args:
             data: Data to write to skillset.yaml
         """
-        with open(self.skillset_path, 'w') as f:
-            yaml.safe_dump(
-                data,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True
-            )
+        text = _fast_dump(data)
+        with self.skillset_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            if text is not None:
+                f.write(text)
+            else:
+                # Stream straight into the buffered file instead of building a string
+                _yaml_dump(data, f)
+        self._remember(data)
@@ -1,19 +1,123 @@
 """GitHub source handler."""
+import contextlib
+import functools
 import hashlib
+import io
+import os
+import posixpath
 import re
 import shutil
 import sys
 import tarfile
 import tempfile
+import time
 import warnings
+import zlib
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from types import ModuleType
+from typing import Any, Callable, Iterator, Optional, Tuple, Type, Union
 
 import requests
 
 from asma.core.sources.base import ResolvedSource, SourceHandler
 from asma.models.skill import Skill
 
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    # Optional faster JSON decoder
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    import json
+
+    _json_loads = json.loads
+
+_zstandard: Optional[ModuleType]
+try:
+    # Optional zstd support for tarball downloads
+    import zstandard
+
+    _zstandard = zstandard
+except ImportError:  # pragma: no cover - depends on installed extras
+    _zstandard = None
+
+# Full 40-character git commit SHA (immutable, safe to use as a cache key)
+_COMMIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+
+# Errors raised by tarfile and the tarball decompressors on a corrupt archive
+_EXTRACT_ERRORS: Tuple[Type[BaseException], ...] = (tarfile.TarError, zlib.error)
+if _zstandard is not None:
+    _EXTRACT_ERRORS += (_zstandard.ZstdError,)
+
+# First bytes of a gzip member
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# github:owner/repo[/path]
+_GITHUB_SOURCE_RE = re.compile(r"github:([^/]*)/([^/]*)(?:/(.*))?", re.DOTALL)
+
+
+# Environment variables Path.home() reads, on POSIX and Windows
+_HOME_ENV_VARS = ("HOME", "USERPROFILE", "HOMEDRIVE", "HOMEPATH")
+
+
+@functools.lru_cache(maxsize=8)
+def _cache_dir_for_home(home_env: Tuple[Optional[str], ...]) -> Path:
+    """Tarball cache directory for one set of home directory variables."""
+    return Path.home() / ".cache" / "asma" / "github"
+
+
+def _default_cache_dir() -> Path:
+    """Default tarball cache directory under the current user's home."""
+    # Keyed on the variables Path.home() uses, so changing HOME is still honored
+    return _cache_dir_for_home(tuple(map(os.environ.get, _HOME_ENV_VARS)))
+
+
+@dataclass(frozen=True)
+class _DownloadCacheKeys:
+    """Cache locations for one download, shared by download() and the preflight count."""
+
+    subpath: Optional[str]
+    # Distinguishes entries extracted for different subpaths
+    suffix: str
+    url_hash: str
+    # Content-addressed entry, if the commit is a full SHA
+    sha_dir: Optional[Path]
+    # Pointer to the tree a mutable ref resolved to recently
+    ref_file: Path
+    lock_file: Path
+
+
+def _escapes_root(norm_path: str) -> bool:
+    """Check whether a normalized relative POSIX path points above its root."""
+    return norm_path == ".." or norm_path.startswith("../")
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on a file, across threads and processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as lock:
+        if sys.platform == "win32":
+            import msvcrt
+
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
 
 def parse_github_source(source: str) -> Tuple[str, str, Optional[str]]:
     """
@@ -28,27 +132,131 @@ def parse_github_source(source: str) -> Tuple[str, str, Optional[str]]:
     Raises:
         ValueError: If format is invalid
     """
-    if not source.startswith("github:"):
+    match = _GITHUB_SOURCE_RE.fullmatch(source)
+    if not match:
         raise ValueError(f"Invalid GitHub source format: {source}")
 
-    # Remove "github:" prefix
-    path_part = source[7:]  # len("github:") == 7
+    owner, repo, subpath = match.groups()
+    return owner, repo, subpath
+
 
-    parts = path_part.split("/")
-    if len(parts) < 2:
-        raise ValueError(f"Invalid GitHub source format: {source}")
+class _HashingReader:
+    """File-like wrapper that hashes bytes as they are read."""
 
-    owner = parts[0]
-    repo = parts[1]
-    subpath = "/".join(parts[2:]) if len(parts) > 2 else None
+    def __init__(self, raw: Any, hasher: "hashlib._Hash"):
+        self._raw = raw
+        self.hasher = hasher
 
-    return owner, repo, subpath
+    def read(self, size: int = -1) -> bytes:
+        data: bytes = self._raw.read(size)
+        self.hasher.update(data)
+        return data
+
+
+class _SizeLimitedReader(io.RawIOBase):
+    """Readable stream that fails once its source yields more than max_size bytes."""
+
+    def __init__(self, raw: Any, max_size: int):
+        self._raw = raw
+        self._max_size = max_size
+        self._total = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        size: int = self._raw.readinto(b)
+        self._total += size
+        if self._total > self._max_size:
+            raise ValueError(
+                f"Decompressed tarball exceeds limit (max {self._max_size} bytes). "
+                f"Possible tar bomb attack."
+            )
+        return size
+
+
+class _DecompressingStream(io.RawIOBase):
+    """
+    Readable stream that decompresses a source in large chunks.
+
+    Reading big compressed blocks per call amortizes Python-level overhead
+    compared to tarfile's built-in gzip layer, which works in small reads.
+    Output is written straight into the caller's buffer and never exceeds
+    its size, so a highly compressible chunk cannot inflate all at once.
+    The decompressor is a zlib decompression object.
+    """
+
+    def __init__(self, src: Any, decompressor: Any, chunk_size: int = 256 * 1024):
+        self._src = src
+        self._chunk_size = chunk_size
+        self._decompressor = decompressor
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        view = memoryview(b).cast("B")
+        # max_length=0 would mean "no limit"
+        if not view:
+            return 0
+        while not self._decompressor.eof:
+            chunk = self._decompressor.unconsumed_tail or self._src.read(self._chunk_size)
+            if not chunk:
+                raise tarfile.ReadError(
+                    "Compressed stream ended before the end-of-stream marker"
+                )
+            data = self._decompressor.decompress(chunk, len(view))
+            if data:
+                size = len(data)
+                view[:size] = data
+                return size
+        return 0
+
+
+class _FastTarFile(tarfile.TarFile):
+    """TarFile that writes regular members with kernel-side copies when possible."""
+
+    def makefile(
+        self,
+        tarinfo: tarfile.TarInfo,
+        targetpath: Union[str, bytes, "os.PathLike[str]", "os.PathLike[bytes]"]
+    ) -> None:
+        copy_file_range = getattr(os, "copy_file_range", None)
+        # fileno() is optional on tarfile's file objects
+        fileno = getattr(self.fileobj, "fileno", None)
+        if copy_file_range is None or fileno is None or tarinfo.sparse is not None:
+            super().makefile(tarinfo, targetpath)
+            return
+
+        try:
+            src_fd = fileno()
+        except (OSError, io.UnsupportedOperation):
+            super().makefile(tarinfo, targetpath)
+            return
+
+        with open(targetpath, "wb") as target:
+            offset = tarinfo.offset_data
+            remaining = tarinfo.size
+            try:
+                while remaining:
+                    copied = copy_file_range(src_fd, target.fileno(), remaining, offset)
+                    if copied == 0:
+                        raise tarfile.ReadError("unexpected end of data")
+                    offset += copied
+                    remaining -= copied
+                return
+            except OSError:
+                # Not supported for this pair of files; copy through userspace
+                pass
+
+        super().makefile(tarinfo, targetpath)
 
 
 class GitHubSourceHandler(SourceHandler):
     """Handle github:owner/repo sources."""
 
     API_BASE = "https://api.github.com"
+    API_VERSION = "2022-11-28"  # Pinned REST API version
 
     # Security limits for tar extraction (tar bomb protection)
     MAX_EXTRACT_SIZE = 500 * 1024 * 1024  # 500 MB total
@@ -56,11 +264,18 @@ class GitHubSourceHandler(SourceHandler):
     MAX_SINGLE_FILE_SIZE = 100 * 1024 * 1024  # 100 MB per file
     MAX_FILENAME_LENGTH = 255  # Standard filesystem limit
 
+    # Chunk size for reading and decompressing downloaded tarballs
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+    # How long a mutable ref (branch/tag) is trusted to point at a cached commit
+    REF_CACHE_TTL = 60 * 60  # 1 hour
+
     def __init__(
         self,
         token: Optional[str] = None,
         cache_dir: Optional[Path] = None,
-        strict: bool = False
+        strict: bool = False,
+        default_branch_hint: Optional[str] = None
     ):
         """
         Initialize GitHub source handler.
@@ -70,13 +285,21 @@ class GitHubSourceHandler(SourceHandler):
             cache_dir: Directory for caching downloaded tarballs
             strict: If True, raise error when version/ref not specified.
                     If False (default), emit warning and use default branch.
+            default_branch_hint: Branch to try (e.g. "main") before asking the
+                    API for a repository's default branch.
         """
         self.token = token
-        self.cache_dir = cache_dir or Path.home() / ".cache" / "asma" / "github"
+        self.cache_dir = cache_dir if cache_dir is not None else _default_cache_dir()
         self.strict = strict
+        self.default_branch_hint = default_branch_hint
         self._pending_subpath: Optional[str] = None
 
-    def _safe_extract_tarball(self, tar: tarfile.TarFile, extract_dir: Path) -> None:
+    def _safe_extract_tarball(
+        self,
+        tar: tarfile.TarFile,
+        extract_dir: Path,
+        subpath: Optional[str] = None
+    ) -> None:
         """
         Safely extract tarball with comprehensive security checks.
 
@@ -93,17 +316,24 @@ class GitHubSourceHandler(SourceHandler):
         Args:
             tar: Open tarfile object
             extract_dir: Directory to extract to
+            subpath: If given, only extract members under this path below the
+                     archive's root directory (e.g. "skills/my-skill")
 
         Raises:
             ValueError: If tarball contains dangerous content or exceeds limits
         """
+        members = [
+            member for member in tar.getmembers()
+            if subpath is None or self._is_under_subpath(member.name, subpath)
+        ]
+
         if sys.version_info >= (3, 12):
             # Python 3.12+: use built-in data filter for secure extraction
             # Still need to check for tar bomb even with filter
             total_size = 0
             file_count = 0
 
-            for member in tar.getmembers():
+            for member in members:
                 # Tar bomb protection: check file count
                 file_count += 1
                 if file_count > self.MAX_FILE_COUNT:
@@ -127,15 +357,14 @@ class GitHubSourceHandler(SourceHandler):
                         f"max {self.MAX_EXTRACT_SIZE}). Possible tar bomb attack."
                     )
 
-            tar.extractall(path=extract_dir, filter="data")
+            tar.extractall(path=extract_dir, members=members, filter="data")
         else:
             # Python 3.8-3.11: manual validation for security
             safe_members = []
-            extract_dir_resolved = extract_dir.resolve()
             total_size = 0
             file_count = 0
 
-            for member in tar.getmembers():
+            for member in members:
                 # Tar bomb protection: check file count
                 file_count += 1
                 if file_count > self.MAX_FILE_COUNT:
@@ -185,21 +414,18 @@ class GitHubSourceHandler(SourceHandler):
                 if member.mode & 0o6000:  # Check for setuid (4000) or setgid (2000)
                     member.mode &= 0o1777  # Remove setuid/setgid, keep other bits
 
-                # Resolve member path and ensure it's within extract_dir
-                member_path = (extract_dir / member.name).resolve()
-
-                # Check for path traversal
-                try:
-                    member_path.relative_to(extract_dir_resolved)
-                except ValueError:
+                # Check for absolute paths
+                if os.path.isabs(member.name):
                     raise ValueError(
-                        f"Attempted path traversal in tar archive: {member.name}"
+                        f"Absolute path in tar archive: {member.name}"
                     )
 
-                # Check for absolute paths
-                if Path(member.name).is_absolute():
+                # Check for path traversal lexically; the extraction directory is
+                # freshly created, so there are no on-disk symlinks to resolve
+                member_norm = posixpath.normpath(member.name)
+                if _escapes_root(member_norm):
                     raise ValueError(
-                        f"Absolute path in tar archive: {member.name}"
+                        f"Attempted path traversal in tar archive: {member.name}"
                     )
 
                 # Validate symlinks and hardlinks
@@ -218,11 +444,11 @@ class GitHubSourceHandler(SourceHandler):
                             f"Path traversal in symlink: {member.name} -> {member.linkname}"
                         )
 
-                    # Resolve link target and ensure it's within extract_dir
-                    link_dest = (extract_dir / member.name).parent / member.linkname
-                    try:
-                        link_dest.resolve().relative_to(extract_dir_resolved)
-                    except ValueError:
+                    # Ensure the link target stays within extract_dir
+                    link_dest = posixpath.normpath(
+                        posixpath.join(posixpath.dirname(member_norm), member.linkname)
+                    )
+                    if _escapes_root(link_dest):
                         raise ValueError(
                             f"Symlink target outside extraction directory: "
                             f"{member.name} -> {member.linkname}"
@@ -233,16 +459,50 @@ class GitHubSourceHandler(SourceHandler):
             # Extract only validated members
             tar.extractall(path=extract_dir, members=safe_members)
 
-    def _get_headers(self) -> dict:
-        """Get headers for GitHub API requests."""
+    @staticmethod
+    def _is_under_subpath(name: str, subpath: str) -> bool:
+        """
+        Check whether a tar member lies under a subpath of the archive root.
+
+        Args:
+            name: Member name, starting with the archive's root directory
+            subpath: Path relative to the archive root
+
+        Returns:
+            True if the member is the subpath itself or inside it
+        """
+        _, _, relative = name.partition("/")
+        relative = relative.rstrip("/")
+        return relative == subpath or relative.startswith(subpath + "/")
+
+    @property
+    def token(self) -> Optional[str]:
+        """GitHub API token sent with every request, if any."""
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        self._token = value
+        # Rebuild the cached headers with the new Authorization value
+        self.__dict__.pop("headers", None)
+
+    @functools.cached_property
+    def headers(self) -> dict:
+        """Headers for GitHub API requests, built once per handler. Do not mutate."""
         headers = {
-            "Accept": "application/vnd.github.v3+json",
+            "Accept": "application/vnd.github+json",
+            "Accept-Encoding": "gzip, deflate",
+            "X-GitHub-Api-Version": self.API_VERSION,
             "User-Agent": "asma-skill-manager"
         }
         if self.token:
             headers["Authorization"] = f"token {self.token}"
         return headers
 
+    def _get_headers(self) -> dict:
+        """Get headers for GitHub API requests."""
+        return self.headers
+
     def _api_request(self, endpoint: str) -> dict:
         """
         Make a GitHub API request.
@@ -260,7 +520,7 @@ class GitHubSourceHandler(SourceHandler):
         """
         url = f"{self.API_BASE}{endpoint}"
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=30)
+            response = requests.get(url, headers=self.headers, timeout=30)
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"Failed to connect to GitHub API: {e}")
 
@@ -269,18 +529,150 @@ class GitHubSourceHandler(SourceHandler):
         elif response.status_code == 401:
             raise PermissionError("GitHub authentication failed: invalid token")
         elif response.status_code == 403:
-            message = response.json().get("message", "")
+            message = _json_loads(response.content).get("message", "")
             if "rate limit" in message.lower():
                 raise PermissionError(f"GitHub API rate limit exceeded: {message}")
             raise PermissionError(f"GitHub access denied: {message}")
         elif response.status_code != 200:
             raise ConnectionError(f"GitHub API error: {response.status_code}")
 
-        result = response.json()
+        result = _json_loads(response.content)
         if not isinstance(result, dict):
             raise ValueError("Expected JSON object from GitHub API")
         return result
 
+    @staticmethod
+    def requests_needed(skill: Skill) -> int:
+        """
+        Estimate GitHub API requests needed to resolve and download a skill.
+
+        Args:
+            skill: Skill with github: source
+
+        Returns:
+            Number of requests counted against the core rate limit
+        """
+        # Tarball download, plus a lookup unless a tag or ref is pinned
+        if skill.ref or (skill.version and skill.version != "latest"):
+            return 1
+        return 2
+
+    def network_requests_needed(self, skill: Skill) -> int:
+        """
+        Count the API requests installing a skill would make, given the local caches.
+
+        Pinned commits already in the cache and refs downloaded within
+        REF_CACHE_TTL need no requests at all.
+
+        Args:
+            skill: Skill with github: source
+
+        Returns:
+            Number of requests counted against the core rate limit
+
+        Raises:
+            ValueError: If source format is invalid
+        """
+        owner, repo, subpath = parse_github_source(skill.source)
+        if skill.ref:
+            ref = skill.ref
+        elif skill.version and skill.version != "latest":
+            ref = skill.version
+        else:
+            # The ref comes from an API lookup, so the cache cannot be consulted
+            return self.requests_needed(skill)
+
+        keys = self._download_cache_keys(self._tarball_url(owner, repo, ref), ref, subpath)
+        if keys.sha_dir is not None and keys.sha_dir.exists():
+            return 0
+        if self._read_cache_pointer(keys.ref_file, max_age=self.REF_CACHE_TTL) is not None:
+            return 0
+        return 1
+
+    def _tarball_url(self, owner: str, repo: str, ref: str) -> str:
+        """Build the API URL of the tarball for a ref."""
+        return f"{self.API_BASE}/repos/{owner}/{repo}/tarball/{ref}"
+
+    def _download_cache_keys(
+        self,
+        download_url: str,
+        commit: str,
+        subpath: Optional[str]
+    ) -> _DownloadCacheKeys:
+        """
+        Derive the cache locations for a download.
+
+        Args:
+            download_url: Tarball URL
+            commit: Resolved commit or ref
+            subpath: Path within the repository, if any
+
+        Returns:
+            Cache keys and paths for the download
+        """
+        # Only the requested subpath is extracted, so it is part of every key
+        subpath = (subpath or "").strip("/") or None
+        suffix = "-" + hashlib.sha256(subpath.encode()).hexdigest()[:16] if subpath else ""
+        url_hash = hashlib.sha256(download_url.encode()).hexdigest()[:16]
+        sha_dir = None
+        if _COMMIT_SHA_RE.match(commit):
+            sha_dir = self.cache_dir / "sha" / f"{commit}{suffix}"
+        return _DownloadCacheKeys(
+            subpath=subpath,
+            suffix=suffix,
+            url_hash=url_hash,
+            sha_dir=sha_dir,
+            ref_file=self.cache_dir / "refs" / f"{url_hash}{suffix}",
+            lock_file=self.cache_dir / "locks" / f"{url_hash}{suffix}.lock",
+        )
+
+    def preflight(self, n_needed: int) -> None:
+        """
+        Check that enough API quota remains before starting a batch.
+
+        The /rate_limit endpoint does not count against the quota itself.
+
+        Args:
+            n_needed: Number of API requests the batch will make
+
+        Raises:
+            PermissionError: If the remaining core quota is insufficient
+            FileNotFoundError: If the server has no /rate_limit endpoint
+            ConnectionError: If network error occurs
+        """
+        data = self._api_request("/rate_limit")
+        core = data.get("resources", {}).get("core", {})
+        remaining = core.get("remaining")
+        if remaining is None or remaining >= n_needed:
+            return
+
+        reset_at = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(core.get("reset", 0)))
+        raise PermissionError(
+            f"GitHub API rate limit too low: need {n_needed} requests, "
+            f"{remaining} remaining (resets at {reset_at})"
+        )
+
+    def _tarball_exists(self, owner: str, repo: str, ref: str) -> bool:
+        """
+        Check whether a tarball is available for a ref.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ref: Branch, tag, or commit
+
+        Returns:
+            True if GitHub serves a tarball for the ref, False otherwise
+        """
+        url = self._tarball_url(owner, repo, ref)
+        try:
+            response = requests.head(url, headers=self.headers, timeout=30)
+        except requests.exceptions.RequestException:
+            return False
+
+        # GitHub answers with a redirect to codeload when the ref exists
+        return response.status_code < 400
+
     def resolve(self, skill: Skill) -> ResolvedSource:
         """
         Resolve GitHub source to downloadable information.
@@ -327,12 +719,16 @@ class GitHubSourceHandler(SourceHandler):
                 stacklevel=2
             )
 
-            # Get default branch
-            data = self._api_request(f"/repos/{owner}/{repo}")
-            ref = data["default_branch"]
+            # Get default branch, trying the hint before spending an API call
+            hint = self.default_branch_hint
+            if hint and self._tarball_exists(owner, repo, hint):
+                ref = hint
+            else:
+                data = self._api_request(f"/repos/{owner}/{repo}")
+                ref = data["default_branch"]
 
         # Build download URL
-        download_url = f"{self.API_BASE}/repos/{owner}/{repo}/tarball/{ref}"
+        download_url = self._tarball_url(owner, repo, ref)
 
         return ResolvedSource(
             version=ref,
@@ -360,41 +756,232 @@ class GitHubSourceHandler(SourceHandler):
         # Create cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate cache key from URL
-        url_hash = hashlib.sha256(resolved.download_url.encode()).hexdigest()[:16]
-        cache_key = f"{url_hash}_{resolved.version}"
-        extract_dir = self.cache_dir / cache_key
+        keys = self._download_cache_keys(
+            resolved.download_url, resolved.commit, self._pending_subpath
+        )
+        subpath = keys.subpath
+        key_suffix = keys.suffix
+        ref_file = keys.ref_file
+
+        # Immutable commit: the content-addressed entry needs no network I/O
+        if keys.sha_dir is not None and keys.sha_dir.exists():
+            return self._get_skill_path(keys.sha_dir)
+
+        # Serialize concurrent downloads of the same entry across processes
+        with _file_lock(keys.lock_file):
+            # Mutable ref: reuse the commit it pointed to if seen recently
+            cached_dir = self._read_cache_pointer(ref_file, max_age=self.REF_CACHE_TTL)
+            if cached_dir is not None:
+                return self._get_skill_path(cached_dir)
+
+            # Download tarball
+            headers = self.headers
+            if _zstandard is not None:
+                # Let servers that can send a zstd-compressed tar do so
+                headers = {**headers, "Accept-Encoding": "zstd, gzip, deflate"}
+            try:
+                response = requests.get(
+                    resolved.download_url,
+                    headers=headers,
+                    stream=True,
+                    timeout=60
+                )
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"Failed to download from GitHub: {e}")
+
+            # Archive already extracted under another URL or ref: skip the body
+            etag = response.headers.get("ETag")
+            etag_file = None
+            if etag:
+                etag_hash = hashlib.sha256(etag.encode()).hexdigest()[:16]
+                etag_file = self.cache_dir / "etag" / f"{etag_hash}{key_suffix}"
+                cached_dir = self._read_cache_pointer(etag_file)
+                if cached_dir is not None:
+                    response.close()
+                    self._write_cache_pointer(ref_file, cached_dir)
+                    return self._get_skill_path(cached_dir)
+
+            # Extract into a temporary directory, then move it into place atomically
+            tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.cache_dir))
+            try:
+                # Headers and padding take at most a few blocks per member
+                max_tar_size = (
+                    self.MAX_EXTRACT_SIZE + self.MAX_FILE_COUNT * 4 * tarfile.BLOCKSIZE
+                )
+                # Spool the compressed body first, hashing it on the way through,
+                # so an archive seen before is recognized without decompressing it
+                with tempfile.TemporaryFile(dir=self.cache_dir) as body:
+                    reader = _HashingReader(response.raw, hashlib.sha256())
+                    while True:
+                        chunk = reader.read(self.DOWNLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        body.write(chunk)
+                        if body.tell() > max_tar_size:
+                            raise ValueError(
+                                f"Tarball exceeds limit (max {max_tar_size} bytes). "
+                                f"Possible tar bomb attack."
+                            )
+                    blob_file = self.cache_dir / "blob" / f"{reader.hasher.hexdigest()}{key_suffix}"
+
+                    # Identical archive seen before: reuse its tree as-is
+                    cached_dir = self._read_cache_pointer(blob_file)
+                    if cached_dir is not None:
+                        shutil.rmtree(tmp_dir, ignore_errors=True)
+                        self._record_download(cached_dir, ref_file, etag_file)
+                        return self._get_skill_path(cached_dir)
+
+                    # Spool the decompressed tar to disk so members can be
+                    # validated before any extraction
+                    body.seek(0)
+                    with tempfile.TemporaryFile(dir=self.cache_dir) as spool:
+                        stream = self._open_tarball_stream(response, body, max_tar_size)
+                        shutil.copyfileobj(stream, spool, self.DOWNLOAD_CHUNK_SIZE)
+                        spool.seek(0)
+                        with _FastTarFile(
+                            fileobj=spool,
+                            mode="r",
+                            copybufsize=self.DOWNLOAD_CHUNK_SIZE
+                        ) as tar:
+                            self._safe_extract_tarball(tar, tmp_dir, subpath=subpath)
+                            archive_commit = tar.pax_headers.get("comment", "")
+
+                # Refuse an archive of a different commit than the one requested
+                if (
+                    _COMMIT_SHA_RE.match(resolved.commit)
+                    and _COMMIT_SHA_RE.match(archive_commit)
+                    and archive_commit != resolved.commit
+                ):
+                    raise ValueError(
+                        f"Tarball commit mismatch: expected {resolved.commit}, "
+                        f"got {archive_commit}"
+                    )
+            except _EXTRACT_ERRORS as e:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise ValueError(f"Failed to extract tarball: {e}")
+            except ValueError:
+                # Security validation error
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise
+
+            # git archive records the commit SHA in the pax global header
+            if _COMMIT_SHA_RE.match(archive_commit):
+                commit = archive_commit
+            elif _COMMIT_SHA_RE.match(resolved.commit):
+                commit = resolved.commit
+            else:
+                commit = None
 
-        # Check cache
-        if extract_dir.exists():
+            if commit is not None:
+                extract_dir = self.cache_dir / "sha" / f"{commit}{key_suffix}"
+            else:
+                # Commit unknown: fall back to a key derived from the URL
+                extract_dir = self.cache_dir / f"{keys.url_hash}_{resolved.version}{key_suffix}"
+            self._commit_extract_dir(tmp_dir, extract_dir, replace=commit is None)
+
+            self._record_download(extract_dir, ref_file, etag_file, blob_file)
             return self._get_skill_path(extract_dir)
 
-        # Download tarball
-        try:
-            response = requests.get(
-                resolved.download_url,
-                headers=self._get_headers(),
-                stream=True,
-                timeout=60
+    def _open_tarball_stream(
+        self,
+        response: requests.Response,
+        src: Any,
+        max_size: int
+    ) -> Union[io.RawIOBase, io.BufferedIOBase]:
+        """
+        Wrap a tarball response body in a stream of the uncompressed tar.
+
+        GitHub serves gzipped tarballs. A zstd Content-Encoding (only
+        advertised when zstandard is installed) is a transfer encoding on
+        top of that, so its output is gunzipped too unless the server sent
+        a zstd-compressed plain tar.
+
+        Args:
+            response: Streaming tarball response
+            src: Readable response body
+            max_size: Maximum number of bytes of any decompressed layer
+
+        Returns:
+            Readable stream of the uncompressed tar
+        """
+        content_encoding = response.headers.get("Content-Encoding", "")
+        if _zstandard is not None and "zstd" in content_encoding:
+            reader = _zstandard.ZstdDecompressor().stream_reader(
+                src, read_size=self.DOWNLOAD_CHUNK_SIZE, closefd=False
             )
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"Failed to download from GitHub: {e}")
+            decoded = io.BufferedReader(
+                _SizeLimitedReader(reader, max_size), self.DOWNLOAD_CHUNK_SIZE
+            )
+            if decoded.peek(len(_GZIP_MAGIC))[:len(_GZIP_MAGIC)] != _GZIP_MAGIC:
+                return decoded
+            src = decoded
+        stream = _DecompressingStream(
+            src, zlib.decompressobj(16 + zlib.MAX_WBITS), self.DOWNLOAD_CHUNK_SIZE
+        )
+        return _SizeLimitedReader(stream, max_size)
 
-        # Extract tarball
-        extract_dir.mkdir(parents=True, exist_ok=True)
-        try:
-            with tarfile.open(fileobj=response.raw, mode="r|gz") as tar:
-                self._safe_extract_tarball(tar, extract_dir)
-        except tarfile.TarError as e:
-            shutil.rmtree(extract_dir, ignore_errors=True)
-            raise ValueError(f"Failed to extract tarball: {e}")
-        except ValueError as e:
-            # Security validation error
+    def _record_download(self, extract_dir: Path, *pointer_files: Optional[Path]) -> None:
+        """Point every cache key learned during a download at its extracted tree."""
+        for pointer_file in pointer_files:
+            if pointer_file is not None:
+                self._write_cache_pointer(pointer_file, extract_dir)
+
+    def _commit_extract_dir(self, tmp_dir: Path, extract_dir: Path, replace: bool) -> None:
+        """
+        Move a freshly extracted tree into its final cache location.
+
+        Args:
+            tmp_dir: Temporary extraction directory
+            extract_dir: Final cache directory
+            replace: If True, replace an existing entry. Otherwise an existing
+                     entry is kept, since content-addressed entries never change.
+        """
+        extract_dir.parent.mkdir(parents=True, exist_ok=True)
+        if extract_dir.exists():
+            if not replace:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                return
             shutil.rmtree(extract_dir, ignore_errors=True)
-            raise
 
-        return self._get_skill_path(extract_dir)
+        try:
+            os.rename(tmp_dir, extract_dir)
+        except OSError:
+            # Another process committed the same entry first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not extract_dir.exists():
+                raise
+
+    def _read_cache_pointer(
+        self,
+        pointer_file: Path,
+        max_age: Optional[float] = None
+    ) -> Optional[Path]:
+        """
+        Follow a cache pointer file to the extracted tree it names.
+
+        Args:
+            pointer_file: Pointer file (ref, ETag, or archive digest)
+            max_age: Maximum pointer age in seconds, or None for no limit
+
+        Returns:
+            Cached extract directory, or None if unknown, stale, or missing
+        """
+        try:
+            if max_age is not None and time.time() - pointer_file.stat().st_mtime > max_age:
+                return None
+            extract_dir = self.cache_dir / pointer_file.read_text().strip()
+        except OSError:
+            return None
+
+        if not extract_dir.is_dir():
+            return None
+        return extract_dir
+
+    def _write_cache_pointer(self, pointer_file: Path, extract_dir: Path) -> None:
+        """Record which extracted tree a cache key currently resolves to."""
+        pointer_file.parent.mkdir(parents=True, exist_ok=True)
+        pointer_file.write_text(str(extract_dir.relative_to(self.cache_dir)))
 
     def _get_skill_path(self, extract_dir: Path) -> Path:
         """
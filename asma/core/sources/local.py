@@ -1,10 +1,70 @@
 """Local filesystem source handler."""
 import hashlib
+import mmap
+import os
+import stat
+from collections import OrderedDict
 from pathlib import Path
+from typing import Tuple
 
 from asma.core.sources.base import SourceHandler, ResolvedSource
 from asma.models.skill import Skill
 
+# SKILL.md sha256 digests keyed by (path, st_mtime_ns, st_size), most recent last
+_CHECKSUM_CACHE: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_CHECKSUM_CACHE_SIZE = 1024
+# Files at least this large are hashed straight from a memory map
+_MMAP_THRESHOLD = 1024 * 1024
+# hashlib.file_digest is new in Python 3.11
+_file_digest = getattr(hashlib, "file_digest", None)
+
+
+def _sha256_file(path: str, size: int) -> str:
+    """
+    Hash a file with sha256 without a Python-level read loop.
+
+    Args:
+        path: File to hash
+        size: File size in bytes, as already returned by stat()
+
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(path, "rb") as f:
+        if size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        if _file_digest is not None:
+            return str(_file_digest(f, "sha256").hexdigest())
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _skill_md_checksum(skill_md: str) -> str:
+    """
+    Return the sha256 hex digest of SKILL.md, reusing it while the file is unchanged.
+
+    Args:
+        skill_md: Absolute path to SKILL.md
+
+    Returns:
+        Hex digest of the file contents
+
+    Raises:
+        FileNotFoundError: If SKILL.md does not exist
+    """
+    st = os.stat(skill_md)
+    key = (skill_md, st.st_mtime_ns, st.st_size)
+    checksum = _CHECKSUM_CACHE.get(key)
+    if checksum is not None:
+        _CHECKSUM_CACHE.move_to_end(key)
+        return checksum
+
+    checksum = _sha256_file(skill_md, st.st_size)
+    _CHECKSUM_CACHE[key] = checksum
+    if len(_CHECKSUM_CACHE) > _CHECKSUM_CACHE_SIZE:
+        _CHECKSUM_CACHE.popitem(last=False)
+    return checksum
+
 
 class LocalSourceHandler(SourceHandler):
     """Handle local:path sources."""
@@ -25,27 +85,27 @@ class LocalSourceHandler(SourceHandler):
         """
         # Parse path from source (remove "local:" prefix)
         path_str = skill.source.replace("local:", "")
-        path = Path(path_str).expanduser().resolve()
+        path = os.path.realpath(os.path.expanduser(path_str))
 
         # Check path exists
-        if not path.exists():
-            raise FileNotFoundError(f"Local skill not found: {path}")
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Local skill not found: {path}") from None
 
-        if not path.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             raise ValueError(f"Local skill path must be directory: {path}")
 
-        # Check for SKILL.md
-        skill_md = path / "SKILL.md"
-        if not skill_md.exists():
-            raise ValueError(f"SKILL.md not found in {path}")
-
         # Calculate checksum of SKILL.md for version tracking
-        checksum = hashlib.sha256(skill_md.read_bytes()).hexdigest()
+        try:
+            checksum = _skill_md_checksum(os.path.join(path, "SKILL.md"))
+        except FileNotFoundError:
+            raise ValueError(f"SKILL.md not found in {path}") from None
 
         return ResolvedSource(
             version=f"local@{checksum[:8]}",
             commit=checksum,
-            local_path=path
+            local_path=Path(path)
         )
 
     def download(self, resolved: ResolvedSource) -> Path:
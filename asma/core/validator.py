@@ -1,12 +1,24 @@
 """SKILL.md validator for validating skill structure and metadata."""
+import functools
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import re
-import yaml
+import sys
 
+# Deleting every allowed character leaves nothing behind for a valid name
+_NAME_DELETE_VALID = str.maketrans('', '', 'abcdefghijklmnopqrstuvwxyz0123456789-')
+_NAME_MAX_LENGTH = 64
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+# First read when scanning SKILL.md for frontmatter; later reads double in size
+_HEAD_CHUNK_SIZE = 4096
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+# Distinguishes an absent frontmatter field from one set to null
+_MISSING = object()
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
     """Result of skill validation."""
 
@@ -19,11 +31,14 @@ class ValidationResult:
 class SkillValidator:
     """Validator for SKILL.md files."""
 
-    @staticmethod
-    def validate(skill_path: Path, strict: bool = False) -> ValidationResult:
+    @classmethod
+    def validate(cls, skill_path: Union[Path, str], strict: bool = False) -> ValidationResult:
         """
         Validate a skill directory and its SKILL.md file.
 
+        Results are cached per SKILL.md path, modification time and size, so
+        validating an unchanged skill again does not re-read the file.
+
         Args:
             skill_path: Path to the skill directory
             strict: Enable strict validation mode
@@ -31,39 +46,143 @@ class SkillValidator:
         Returns:
             ValidationResult with validation status and any errors/warnings
         """
-        skill_md = skill_path / "SKILL.md"
-        errors = []
+        skill_md = os.path.abspath(os.path.join(skill_path, "SKILL.md"))
 
         # Check if SKILL.md exists
-        if not skill_md.exists():
-            errors.append("SKILL.md not found")
-            return ValidationResult(valid=False, errors=errors)
+        try:
+            st = os.stat(skill_md)
+        except (FileNotFoundError, NotADirectoryError):
+            return ValidationResult(valid=False, errors=["SKILL.md not found"])
+
+        cached = cls._validate_impl(skill_md, st.st_mtime_ns, st.st_size, strict)
+        # Hand out a copy so callers cannot alter the cached result
+        return ValidationResult(
+            valid=cached.valid,
+            errors=list(cached.errors),
+            warnings=list(cached.warnings),
+            metadata=dict(cached.metadata),
+        )
+
+    @classmethod
+    def validate_all(cls, parent: Path, strict: bool = False) -> Dict[str, ValidationResult]:
+        """
+        Validate every skill directory directly inside a parent directory.
+
+        Uses os.scandir so directory checks come from the listing itself rather
+        than a stat per entry. Hidden directories (starting with ".") and plain
+        files are skipped.
+
+        Args:
+            parent: Directory containing one subdirectory per skill
+            strict: Enable strict validation mode
+
+        Returns:
+            ValidationResult for each skill directory, keyed and sorted by name
+        """
+        with os.scandir(parent) as it:
+            skill_dirs = sorted(
+                (entry.name, entry.path) for entry in it
+                if not entry.name.startswith(".") and entry.is_dir()
+            )
+        return {name: cls.validate(path, strict) for name, path in skill_dirs}
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all cached validation results."""
+        cls._validate_impl.cache_clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _validate_impl(
+        skill_md_str: str, mtime_ns: int, size: int, strict: bool
+    ) -> ValidationResult:
+        """
+        Validate a SKILL.md file; cached by validate().
+
+        Args:
+            skill_md_str: Absolute path to SKILL.md
+            mtime_ns: Modification time of SKILL.md, part of the cache key
+            size: Size of SKILL.md, part of the cache key
+            strict: Enable strict validation mode
+
+        Returns:
+            ValidationResult with validation status and any errors/warnings
+        """
+        errors = []
 
         # Read and parse frontmatter
-        content = skill_md.read_text()
+        content = SkillValidator._read_head(skill_md_str)
         frontmatter = SkillValidator._parse_frontmatter(content)
 
         if frontmatter is None:
             errors.append("SKILL.md missing YAML frontmatter")
             return ValidationResult(valid=False, errors=errors)
 
-        # Validate required fields
-        if "name" not in frontmatter:
+        errors = SkillValidator._check_fields(frontmatter)
+        valid = len(errors) == 0
+        return ValidationResult(valid=valid, errors=errors, metadata=frontmatter)
+
+    @staticmethod
+    def _check_fields(frontmatter: Dict[str, Any]) -> List[str]:
+        """
+        Check the required frontmatter fields in one pass.
+
+        Args:
+            frontmatter: Parsed SKILL.md frontmatter
+
+        Returns:
+            Error messages, empty if all fields are valid
+        """
+        errors = []
+
+        name = frontmatter.get("name", _MISSING)
+        if isinstance(name, str):
+            if not 0 < len(name) <= _NAME_MAX_LENGTH or name.translate(_NAME_DELETE_VALID):
+                errors.append(f"Invalid name format: {name} (must be lowercase letters, numbers, and hyphens only)")
+        elif name is _MISSING:
             errors.append("SKILL.md missing required field: name")
-        elif not isinstance(frontmatter["name"], str):
+        else:
             errors.append("SKILL.md field 'name' must be a string")
-        elif not re.match(r'^[a-z0-9-]{1,64}$', frontmatter["name"]):
-            errors.append(f"Invalid name format: {frontmatter['name']} (must be lowercase letters, numbers, and hyphens only)")
 
-        if "description" not in frontmatter:
+        description = frontmatter.get("description", _MISSING)
+        if isinstance(description, str):
+            if not description.strip():
+                errors.append("SKILL.md field 'description' is empty")
+        elif description is _MISSING:
             errors.append("SKILL.md missing required field: description")
-        elif not isinstance(frontmatter["description"], str):
+        else:
             errors.append("SKILL.md field 'description' must be a string")
-        elif not frontmatter["description"].strip():
-            errors.append("SKILL.md field 'description' is empty")
 
-        valid = len(errors) == 0
-        return ValidationResult(valid=valid, errors=errors, metadata=frontmatter)
+        return errors
+
+    @staticmethod
+    def _read_head(skill_md: str) -> str:
+        """
+        Read SKILL.md only as far as the end of its frontmatter.
+
+        The markdown body is usually much larger than the frontmatter and is
+        never inspected, so reading stops as soon as the closing delimiter has
+        been seen, or right away if the file does not open with one.
+
+        Args:
+            skill_md: Path to SKILL.md
+
+        Returns:
+            Leading file content, containing the whole frontmatter block if any
+        """
+        with open(skill_md) as f:
+            content = f.read(_HEAD_CHUNK_SIZE)
+            if not content.startswith("---"):
+                return content
+
+            size = _HEAD_CHUNK_SIZE
+            while not _FRONTMATTER_RE.match(content):
+                size *= 2
+                chunk = f.read(size)
+                if not chunk:
+                    break
+                content += chunk
+            return content
 
     @staticmethod
     def _parse_frontmatter(content: str) -> Optional[Dict[str, Any]]:
@@ -77,12 +196,17 @@ class SkillValidator:
             Parsed frontmatter as dict, or None if not found/invalid
         """
         # Match frontmatter between --- delimiters
-        match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content)
         if not match:
             return None
 
+        # Imported here so loading this module does not pull in PyYAML
+        import yaml
+
         try:
-            result = yaml.safe_load(match.group(1))
+            result = yaml.load(
+                match.group(1), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            )
             return result if isinstance(result, dict) else None
         except yaml.YAMLError:
             return None
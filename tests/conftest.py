@@ -1,6 +1,11 @@
 """Pytest configuration and shared fixtures."""
+from pathlib import Path
+
 import pytest
 
+_VALID_SKILL_MD = b"---\nname: test-skill\ndescription: Test skill\n---\n# Test\n"
+_INVALID_SKILL_MD = b"---\nname: test-skill\n---\n# Test\n"
+
 
 @pytest.fixture
 def sample_skill_md() -> str:
@@ -81,3 +86,36 @@ project:
   - name: local-skill
     source: local:~/my-skills/local-skill
 """
+
+
+@pytest.fixture(scope="session")
+def valid_skill_source(tmp_path_factory) -> Path:
+    """Return a read-only skill directory with a valid SKILL.md, shared by all tests."""
+    source_dir = tmp_path_factory.mktemp("valid_skill_source").resolve()
+    (source_dir / "SKILL.md").write_bytes(_VALID_SKILL_MD)
+    return source_dir
+
+
+@pytest.fixture(scope="session")
+def copyable_skill_source(tmp_path_factory) -> Path:
+    """Return a read-only skill directory with a valid SKILL.md and one extra file."""
+    source_dir = tmp_path_factory.mktemp("copyable_skill_source").resolve()
+    (source_dir / "SKILL.md").write_bytes(_VALID_SKILL_MD)
+    (source_dir / "extra.txt").write_bytes(b"extra content")
+    return source_dir
+
+
+@pytest.fixture(scope="session")
+def invalid_skill_source(tmp_path_factory) -> Path:
+    """Return a read-only skill directory whose SKILL.md lacks a description."""
+    source_dir = tmp_path_factory.mktemp("invalid_skill_source").resolve()
+    (source_dir / "SKILL.md").write_bytes(_INVALID_SKILL_MD)
+    return source_dir
+
+
+@pytest.fixture
+def extract_dir(tmp_path: Path) -> Path:
+    """Return an empty per-test directory to extract tarballs into."""
+    extract_dir = tmp_path / "extract"
+    extract_dir.mkdir()
+    return extract_dir
@@ -8,6 +8,14 @@ from click.testing import CliRunner
 from asma.cli.main import cli
 
 
+@pytest.fixture(autouse=True)
+def isolated_skillset_cache(tmp_path, monkeypatch):
+    """Keep SkillsetWriter's parse cache out of the real ~/.cache/asma."""
+    cache_dir = tmp_path / "skillsets"
+    monkeypatch.setattr("asma.core.skillset_writer._default_cache_dir", lambda: cache_dir)
+    return cache_dir
+
+
 class TestAddCommand:
     """Test 'asma add' command."""
 
@@ -312,6 +320,15 @@ description: A skill for custom file test
 class TestAddCommandGitHub:
     """Test 'asma add' command with GitHub sources."""
 
+    @pytest.fixture(autouse=True)
+    def isolated_cache_dir(self, tmp_path, monkeypatch):
+        """Point the handler's default download cache at a per-test directory."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(
+            "asma.core.sources.github._default_cache_dir", lambda: cache_dir
+        )
+        return cache_dir
+
     def _create_mock_tarball(self, name: str, description: str) -> bytes:
         """Create a mock tarball with SKILL.md."""
         skill_content = f"""---
@@ -295,6 +295,23 @@ project:
 class TestInstallCommandGitHub:
     """Test 'asma install' command with GitHub sources."""
 
+    @pytest.fixture(autouse=True)
+    def isolated_cache_dir(self, tmp_path, monkeypatch):
+        """Point the handler's default download cache at a per-test directory."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(
+            "asma.core.sources.github._default_cache_dir", lambda: cache_dir
+        )
+        return cache_dir
+
+    @pytest.fixture(autouse=True)
+    def mock_rate_limit(self, requests_mock):
+        """Report plenty of API quota for the install preflight check."""
+        return requests_mock.get(
+            "https://api.github.com/rate_limit",
+            json={"resources": {"core": {"limit": 5000, "remaining": 5000, "reset": 0}}}
+        )
+
     def _create_mock_tarball(self) -> bytes:
         """Create a mock tarball with SKILL.md."""
         tar_buffer = io.BytesIO()
@@ -429,3 +446,84 @@ global:
                 if "api.github.com" in request.url:
                     assert request.headers.get("Authorization") == "token test-token"
 
+    def test_install_github_aborts_when_rate_limit_too_low(self, requests_mock):
+        """Test that install stops before any download when API quota is insufficient."""
+        runner = CliRunner()
+
+        requests_mock.get(
+            "https://api.github.com/rate_limit",
+            json={"resources": {"core": {"limit": 60, "remaining": 1, "reset": 0}}}
+        )
+        tarball = requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=self._create_mock_tarball()
+        )
+
+        with runner.isolated_filesystem() as fs:
+            fs_path = Path(fs)
+
+            skillset = fs_path / "skillset.yaml"
+            skillset.write_text("""
+project:
+  - name: test-skill
+    source: github:owner/repo
+""")
+
+            result = runner.invoke(cli, ['install'])
+
+            assert result.exit_code != 0
+            assert "rate limit" in result.output
+            assert tarball.call_count == 0
+
+    def test_install_github_without_rate_limit_endpoint(self, requests_mock):
+        """Test that install proceeds when /rate_limit is missing, as on some proxies."""
+        runner = CliRunner()
+
+        requests_mock.get("https://api.github.com/rate_limit", status_code=404)
+        tarball = requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=self._create_mock_tarball()
+        )
+
+        with runner.isolated_filesystem() as fs:
+            fs_path = Path(fs)
+
+            skillset = fs_path / "skillset.yaml"
+            skillset.write_text("""
+project:
+  - name: test-skill
+    source: github:owner/repo
+    ref: main
+""")
+
+            result = runner.invoke(cli, ['install'])
+
+            assert result.exit_code == 0, result.output
+            assert tarball.call_count == 1
+            assert (fs_path / ".claude/skills/test-skill/SKILL.md").exists()
+
+    def test_install_github_skips_preflight_when_already_installed(self, requests_mock):
+        """Test that already-installed skills do not count against the API quota."""
+        runner = CliRunner()
+
+        rate_limit = requests_mock.get(
+            "https://api.github.com/rate_limit",
+            json={"resources": {"core": {"limit": 60, "remaining": 0, "reset": 0}}}
+        )
+
+        with runner.isolated_filesystem() as fs:
+            fs_path = Path(fs)
+            (fs_path / ".claude/skills/test-skill").mkdir(parents=True)
+
+            skillset = fs_path / "skillset.yaml"
+            skillset.write_text("""
+project:
+  - name: test-skill
+    source: github:owner/repo
+""")
+
+            result = runner.invoke(cli, ['install'])
+
+            assert "rate limit" not in result.output
+            assert "already exists" in result.output
+            assert rate_limit.call_count == 0
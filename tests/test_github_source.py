@@ -1,16 +1,75 @@
 """Tests for GitHub source handler."""
+import gzip
 import io
 import tarfile
+import threading
+import time
+import zlib
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import requests
 
-from asma.core.sources.github import GitHubSourceHandler, parse_github_source
+from asma.core.sources.github import (
+    GitHubSourceHandler,
+    _DecompressingStream,
+    _SizeLimitedReader,
+    parse_github_source,
+)
 from asma.core.sources.base import ResolvedSource
 from asma.models.skill import Skill, SkillScope
 
 
+def _build_github_tarball(subpath: str = None) -> bytes:
+    """Create a mock tarball with SKILL.md."""
+    # Create the tarball content
+    tar_buffer = io.BytesIO()
+    with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
+        # GitHub tarballs have a root directory like "repo-ref/"
+        root_dir = "repo-main"
+
+        # Add root directory
+        dir_info = tarfile.TarInfo(name=root_dir + "/")
+        dir_info.type = tarfile.DIRTYPE
+        dir_info.mode = 0o755
+        tar.addfile(dir_info)
+
+        if subpath:
+            # Add subpath directories
+            parts = subpath.split("/")
+            current_path = root_dir
+            for part in parts:
+                current_path = f"{current_path}/{part}"
+                subdir_info = tarfile.TarInfo(name=current_path + "/")
+                subdir_info.type = tarfile.DIRTYPE
+                subdir_info.mode = 0o755
+                tar.addfile(subdir_info)
+            skill_path = f"{current_path}/SKILL.md"
+        else:
+            skill_path = f"{root_dir}/SKILL.md"
+
+        # Add SKILL.md
+        skill_content = b"---\nname: test-skill\ndescription: Test\n---\n# Test"
+        skill_info = tarfile.TarInfo(name=skill_path)
+        skill_info.size = len(skill_content)
+        skill_info.mode = 0o644
+        tar.addfile(skill_info, io.BytesIO(skill_content))
+
+    return tar_buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def github_tarball_bytes() -> bytes:
+    """Gzipped GitHub-style tarball with SKILL.md at the root, built once."""
+    return _build_github_tarball()
+
+
+@pytest.fixture(scope="session")
+def github_tarball_with_subpath_bytes() -> bytes:
+    """Gzipped GitHub-style tarball with SKILL.md under skills/my-skill, built once."""
+    return _build_github_tarball(subpath="skills/my-skill")
+
+
 class TestParseGitHubSource:
     """Test parsing github:owner/repo[/path] format."""
 
@@ -78,6 +137,57 @@ class TestGitHubSourceHandler:
         assert resolved.commit == "main"
         assert "tarball/main" in resolved.download_url
 
+    def test_resolve_default_branch_hint_skips_api(self, requests_mock):
+        """Test that a matching default branch hint avoids the repository API call."""
+        skill = Skill(
+            name="test-skill",
+            source="github:anthropics/skills",
+            scope=SkillScope.GLOBAL
+        )
+
+        requests_mock.head(
+            "https://api.github.com/repos/anthropics/skills/tarball/main",
+            status_code=302,
+            headers={"Location": "https://codeload.github.com/anthropics/skills/legacy.tar.gz/main"}
+        )
+        repo_api = requests_mock.get(
+            "https://api.github.com/repos/anthropics/skills",
+            json={"default_branch": "main"}
+        )
+
+        handler = GitHubSourceHandler(default_branch_hint="main")
+        with pytest.warns(UserWarning):
+            resolved = handler.resolve(skill)
+
+        assert repo_api.call_count == 0
+        assert resolved.version == "main"
+        assert "tarball/main" in resolved.download_url
+
+    def test_resolve_default_branch_hint_falls_back_to_api(self, requests_mock):
+        """Test that a missing hinted branch falls back to the repository API."""
+        skill = Skill(
+            name="test-skill",
+            source="github:anthropics/skills",
+            scope=SkillScope.GLOBAL
+        )
+
+        requests_mock.head(
+            "https://api.github.com/repos/anthropics/skills/tarball/main",
+            status_code=404
+        )
+        repo_api = requests_mock.get(
+            "https://api.github.com/repos/anthropics/skills",
+            json={"default_branch": "master"}
+        )
+
+        handler = GitHubSourceHandler(default_branch_hint="main")
+        with pytest.warns(UserWarning):
+            resolved = handler.resolve(skill)
+
+        assert repo_api.call_count == 1
+        assert resolved.version == "master"
+        assert "tarball/master" in resolved.download_url
+
     def test_resolve_with_ref(self, requests_mock):
         """Test resolving with specific ref."""
         skill = Skill(
@@ -176,6 +286,28 @@ class TestGitHubSourceHandler:
         # Then: token should be in request headers
         assert requests_mock.last_request.headers.get("Authorization") == "token test-token"
 
+    def test_resolve_sends_accept_encoding(self, requests_mock):
+        """Test that API requests ask for compressed JSON from a pinned API version."""
+        skill = Skill(
+            name="test-skill",
+            source="github:owner/repo",
+            scope=SkillScope.GLOBAL,
+            version="latest"
+        )
+
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/releases/latest",
+            json={"tag_name": "v2.0.0"}
+        )
+
+        handler = GitHubSourceHandler()
+        handler.resolve(skill)
+
+        headers = requests_mock.last_request.headers
+        assert "gzip" in headers.get("Accept-Encoding")
+        assert headers.get("Accept") == "application/vnd.github+json"
+        assert headers.get("X-GitHub-Api-Version") == "2022-11-28"
+
     def test_resolve_stores_subpath(self, requests_mock):
         """Test that subpath is stored in resolved source."""
         skill = Skill(
@@ -195,44 +327,7 @@ class TestGitHubSourceHandler:
 class TestGitHubSourceHandlerDownload:
     """Test GitHubSourceHandler download functionality."""
 
-    def _create_tarball(self, tmp_path: Path, subpath: str = None) -> bytes:
-        """Create a mock tarball with SKILL.md."""
-        # Create the tarball content
-        tar_buffer = io.BytesIO()
-        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
-            # GitHub tarballs have a root directory like "repo-ref/"
-            root_dir = "repo-main"
-
-            # Add root directory
-            dir_info = tarfile.TarInfo(name=root_dir + "/")
-            dir_info.type = tarfile.DIRTYPE
-            dir_info.mode = 0o755
-            tar.addfile(dir_info)
-
-            if subpath:
-                # Add subpath directories
-                parts = subpath.split("/")
-                current_path = root_dir
-                for part in parts:
-                    current_path = f"{current_path}/{part}"
-                    subdir_info = tarfile.TarInfo(name=current_path + "/")
-                    subdir_info.type = tarfile.DIRTYPE
-                    subdir_info.mode = 0o755
-                    tar.addfile(subdir_info)
-                skill_path = f"{current_path}/SKILL.md"
-            else:
-                skill_path = f"{root_dir}/SKILL.md"
-
-            # Add SKILL.md
-            skill_content = b"---\nname: test-skill\ndescription: Test\n---\n# Test"
-            skill_info = tarfile.TarInfo(name=skill_path)
-            skill_info.size = len(skill_content)
-            skill_info.mode = 0o644
-            tar.addfile(skill_info, io.BytesIO(skill_content))
-
-        return tar_buffer.getvalue()
-
-    def test_download_and_extract(self, tmp_path, requests_mock):
+    def test_download_and_extract(self, tmp_path, requests_mock, github_tarball_bytes):
         """Test downloading and extracting tarball."""
         # Given: resolved source
         resolved = ResolvedSource(
@@ -242,7 +337,7 @@ class TestGitHubSourceHandlerDownload:
         )
 
         # Mock tarball download
-        tarball_content = self._create_tarball(tmp_path)
+        tarball_content = github_tarball_bytes
         requests_mock.get(
             "https://api.github.com/repos/owner/repo/tarball/main",
             content=tarball_content
@@ -256,7 +351,9 @@ class TestGitHubSourceHandlerDownload:
         assert result_path.exists()
         assert (result_path / "SKILL.md").exists()
 
-    def test_download_with_subpath(self, tmp_path, requests_mock):
+    def test_download_with_subpath(
+        self, tmp_path, requests_mock, github_tarball_with_subpath_bytes
+    ):
         """Test downloading with subpath extraction."""
         resolved = ResolvedSource(
             version="main",
@@ -265,7 +362,7 @@ class TestGitHubSourceHandlerDownload:
         )
 
         # Mock tarball with subpath
-        tarball_content = self._create_tarball(tmp_path, subpath="skills/my-skill")
+        tarball_content = github_tarball_with_subpath_bytes
         requests_mock.get(
             "https://api.github.com/repos/owner/repo/tarball/main",
             content=tarball_content
@@ -280,15 +377,50 @@ class TestGitHubSourceHandlerDownload:
         assert result_path.exists()
         assert (result_path / "SKILL.md").exists()
 
-    def test_download_uses_cache(self, tmp_path, requests_mock):
+    def test_download_with_subpath_skips_other_files(self, tmp_path, requests_mock):
+        """Test that only the requested subpath is extracted, cached per subpath."""
+        tar_buffer = io.BytesIO()
+        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
+            for name in ("skill-a", "skill-a-extra", "skill-b"):
+                content = f"---\nname: {name}\ndescription: Test\n---\n".encode()
+                info = tarfile.TarInfo(name=f"repo-main/skills/{name}/SKILL.md")
+                info.size = len(content)
+                tar.addfile(info, io.BytesIO(content))
+
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=tar_buffer.getvalue()
+        )
+        resolved = ResolvedSource(
+            version="main",
+            commit="main",
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        handler._pending_subpath = "skills/skill-a"
+        result_a = handler.download(resolved)
+
+        assert (result_a / "SKILL.md").exists()
+        assert sorted(p.name for p in result_a.parent.iterdir()) == ["skill-a"]
+
+        # A different subpath of the same archive gets its own cache entry
+        handler._pending_subpath = "skills/skill-b"
+        result_b = handler.download(resolved)
+
+        assert (result_b / "SKILL.md").exists()
+        assert sorted(p.name for p in result_b.parent.iterdir()) == ["skill-b"]
+
+    def test_download_uses_cache(self, tmp_path, requests_mock, github_tarball_bytes):
         """Test that cached downloads are reused."""
+        commit = "0123456789abcdef0123456789abcdef01234567"
         resolved = ResolvedSource(
             version="v1.0.0",
-            commit="v1.0.0",
+            commit=commit,
             download_url="https://api.github.com/repos/owner/repo/tarball/v1.0.0"
         )
 
-        tarball_content = self._create_tarball(tmp_path)
+        tarball_content = github_tarball_bytes
         requests_mock.get(
             "https://api.github.com/repos/owner/repo/tarball/v1.0.0",
             content=tarball_content
@@ -307,6 +439,279 @@ class TestGitHubSourceHandlerDownload:
         assert requests_mock.call_count == 1
         assert result1 == result2
 
+        # Cache entry is keyed by the commit SHA, not the ref name
+        assert commit in result1.parts
+
+    def test_download_sha_cache_hit_skips_network(self, tmp_path, requests_mock):
+        """Test that a commit already in the SHA cache is served without any request."""
+        commit = "0123456789abcdef0123456789abcdef01234567"
+        cache_dir = tmp_path / "cache"
+        (cache_dir / "sha" / commit / "repo-main").mkdir(parents=True)
+
+        resolved = ResolvedSource(
+            version="main",
+            commit=commit,
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        )
+
+        handler = GitHubSourceHandler(cache_dir=cache_dir)
+        result = handler.download(resolved)
+
+        assert requests_mock.call_count == 0
+        assert result == cache_dir / "sha" / commit / "repo-main"
+
+    def test_download_keys_branch_by_archive_commit(self, tmp_path, requests_mock):
+        """Test that a branch download is cached under the commit SHA from the archive."""
+        commit = "fedcba9876543210fedcba9876543210fedcba98"
+        tar_buffer = io.BytesIO()
+        with tarfile.open(
+            fileobj=tar_buffer,
+            mode="w:gz",
+            format=tarfile.PAX_FORMAT,
+            pax_headers={"comment": commit}
+        ) as tar:
+            skill_content = b"---\nname: test-skill\ndescription: Test\n---\n# Test"
+            skill_info = tarfile.TarInfo(name="repo-main/SKILL.md")
+            skill_info.size = len(skill_content)
+            tar.addfile(skill_info, io.BytesIO(skill_content))
+
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=tar_buffer.getvalue()
+        )
+        resolved = ResolvedSource(
+            version="main",
+            commit="main",
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        result = handler.download(resolved)
+
+        assert result == tmp_path / "cache" / "sha" / commit / "repo-main"
+        assert (result / "SKILL.md").exists()
+
+    def test_download_same_archive_reuses_hash_dir(
+        self, tmp_path, requests_mock, github_tarball_bytes
+    ):
+        """Test that identical archives under different URLs are unpacked only once."""
+        tarball_content = github_tarball_bytes
+        for ref in ("main", "v1.0.0"):
+            requests_mock.get(
+                f"https://api.github.com/repos/owner/repo/tarball/{ref}",
+                content=tarball_content
+            )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        with patch.object(
+            handler, "_safe_extract_tarball", wraps=handler._safe_extract_tarball
+        ) as extract, patch.object(
+            handler, "_open_tarball_stream", wraps=handler._open_tarball_stream
+        ) as decompress:
+            result1 = handler.download(ResolvedSource(
+                version="main",
+                commit="main",
+                download_url="https://api.github.com/repos/owner/repo/tarball/main"
+            ))
+            result2 = handler.download(ResolvedSource(
+                version="v1.0.0",
+                commit="v1.0.0",
+                download_url="https://api.github.com/repos/owner/repo/tarball/v1.0.0"
+            ))
+
+        assert extract.call_count == 1
+        assert decompress.call_count == 1
+        assert requests_mock.call_count == 2
+        assert result1 == result2
+
+    def test_download_known_etag_skips_body(self, tmp_path, requests_mock, github_tarball_bytes):
+        """Test that a response with an already extracted ETag reuses the cached tree."""
+        tarball_content = github_tarball_bytes
+        for ref in ("main", "v1.0.0"):
+            requests_mock.get(
+                f"https://api.github.com/repos/owner/repo/tarball/{ref}",
+                content=tarball_content,
+                headers={"ETag": '"abc123"'}
+            )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        result1 = handler.download(ResolvedSource(
+            version="main",
+            commit="main",
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        ))
+
+        with patch("asma.core.sources.github.tempfile.TemporaryFile") as spool:
+            result2 = handler.download(ResolvedSource(
+                version="v1.0.0",
+                commit="v1.0.0",
+                download_url="https://api.github.com/repos/owner/repo/tarball/v1.0.0"
+            ))
+
+        spool.assert_not_called()
+        assert result1 == result2
+
+    def test_download_without_copy_file_range(self, tmp_path, requests_mock, github_tarball_bytes):
+        """Test that extraction falls back to a userspace copy when needed."""
+        resolved = ResolvedSource(
+            version="main",
+            commit="main",
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        )
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=github_tarball_bytes
+        )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        with patch("os.copy_file_range", side_effect=OSError("not supported"), create=True):
+            result_path = handler.download(resolved)
+
+        assert (result_path / "SKILL.md").read_bytes() == (
+            b"---\nname: test-skill\ndescription: Test\n---\n# Test"
+        )
+
+    def test_download_concurrent_same_url(self, tmp_path, requests_mock, github_tarball_bytes):
+        """Test that concurrent downloads of one URL fetch the tarball only once."""
+        tarball_content = github_tarball_bytes
+
+        def slow_tarball(request, context):
+            time.sleep(0.2)
+            return tarball_content
+
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=slow_tarball
+        )
+        resolved = ResolvedSource(
+            version="main",
+            commit="main",
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        )
+
+        cache_dir = tmp_path / "cache"
+        barrier = threading.Barrier(2)
+        results = []
+
+        def worker():
+            handler = GitHubSourceHandler(cache_dir=cache_dir)
+            barrier.wait()
+            results.append(handler.download(resolved))
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert requests_mock.call_count == 1
+        assert len(results) == 2
+        assert results[0] == results[1]
+
+    def test_download_zstd_encoded_tarball(self, tmp_path, requests_mock):
+        """Test that a zstd-compressed tar is extracted when zstandard is installed."""
+        zstandard = pytest.importorskip("zstandard")
+
+        tar_buffer = io.BytesIO()
+        with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
+            skill_content = b"---\nname: test-skill\ndescription: Test\n---\n# Test"
+            skill_info = tarfile.TarInfo(name="repo-main/SKILL.md")
+            skill_info.size = len(skill_content)
+            tar.addfile(skill_info, io.BytesIO(skill_content))
+
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=zstandard.ZstdCompressor().compress(tar_buffer.getvalue()),
+            headers={"Content-Encoding": "zstd"}
+        )
+        resolved = ResolvedSource(
+            version="main",
+            commit="main",
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        result_path = handler.download(resolved)
+
+        assert "zstd" in requests_mock.last_request.headers["Accept-Encoding"]
+        assert (result_path / "SKILL.md").exists()
+
+    def test_download_zstd_encoded_gzip_tarball(self, tmp_path, requests_mock):
+        """Test that a zstd transfer encoding over GitHub's gzipped tarball is fully decoded."""
+        zstandard = pytest.importorskip("zstandard")
+
+        tar_buffer = io.BytesIO()
+        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
+            skill_content = b"---\nname: test-skill\ndescription: Test\n---\n# Test"
+            skill_info = tarfile.TarInfo(name="repo-main/SKILL.md")
+            skill_info.size = len(skill_content)
+            tar.addfile(skill_info, io.BytesIO(skill_content))
+
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=zstandard.ZstdCompressor().compress(tar_buffer.getvalue()),
+            headers={"Content-Encoding": "zstd"}
+        )
+        resolved = ResolvedSource(
+            version="main",
+            commit="main",
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        result_path = handler.download(resolved)
+
+        assert (result_path / "SKILL.md").read_bytes() == skill_content
+
+    def test_download_highly_compressible_tarball(self, tmp_path, requests_mock):
+        """Test that a multi-MB all-zero member is decompressed and extracted intact."""
+        size = 16 * 1024 * 1024
+        tar_buffer = io.BytesIO()
+        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
+            skill_content = b"---\nname: test-skill\ndescription: Test\n---\n# Test"
+            skill_info = tarfile.TarInfo(name="repo-main/SKILL.md")
+            skill_info.size = len(skill_content)
+            tar.addfile(skill_info, io.BytesIO(skill_content))
+            zeros_info = tarfile.TarInfo(name="repo-main/zeros.bin")
+            zeros_info.size = size
+            tar.addfile(zeros_info, io.BytesIO(bytes(size)))
+
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=tar_buffer.getvalue()
+        )
+        resolved = ResolvedSource(
+            version="main",
+            commit="main",
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        result_path = handler.download(resolved)
+
+        assert (result_path / "zeros.bin").stat().st_size == size
+
+    def test_decompression_stops_at_size_limit(self):
+        """Test that an all-zero payload is not inflated past the size limit."""
+        limit = 1024 * 1024
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        stream = _SizeLimitedReader(
+            _DecompressingStream(io.BytesIO(gzip.compress(bytes(32 * limit))), decompressor),
+            limit
+        )
+
+        received = 0
+        with pytest.raises(ValueError, match="exceeds limit"):
+            while True:
+                chunk = stream.read(64 * 1024)
+                if not chunk:
+                    break
+                received += len(chunk)
+
+        assert received <= limit
+        # Most of the compressed input was never inflated
+        assert len(decompressor.unconsumed_tail) > 0
+
     def test_download_network_error(self, tmp_path, requests_mock):
         """Test handling network errors during download."""
         resolved = ResolvedSource(
@@ -364,6 +769,78 @@ class TestGitHubSourceHandlerAuth:
         with pytest.raises(PermissionError, match="rate limit"):
             handler.resolve(skill)
 
+    def test_preflight_bails_when_quota_insufficient(self, requests_mock):
+        """Test that preflight fails early when the core quota is too low."""
+        requests_mock.get(
+            "https://api.github.com/rate_limit",
+            json={"resources": {"core": {"limit": 60, "remaining": 3, "reset": 1700000000}}}
+        )
+
+        handler = GitHubSourceHandler()
+        with pytest.raises(PermissionError, match="rate limit.*need 10.*3 remaining"):
+            handler.preflight(10)
+
+    def test_preflight_passes_with_enough_quota(self, requests_mock):
+        """Test that preflight succeeds when the core quota covers the batch."""
+        requests_mock.get(
+            "https://api.github.com/rate_limit",
+            json={"resources": {"core": {"limit": 5000, "remaining": 4999, "reset": 1700000000}}}
+        )
+
+        handler = GitHubSourceHandler()
+        handler.preflight(10)
+
+    def test_requests_needed(self):
+        """Test API request estimates for pinned and unpinned skills."""
+        def skill(**kwargs):
+            return Skill(name="test", source="github:owner/repo", scope=SkillScope.GLOBAL, **kwargs)
+
+        assert GitHubSourceHandler.requests_needed(skill(ref="main")) == 1
+        assert GitHubSourceHandler.requests_needed(skill(version="v1.0.0")) == 1
+        assert GitHubSourceHandler.requests_needed(skill(version="latest")) == 2
+        assert GitHubSourceHandler.requests_needed(skill()) == 2
+
+    def test_network_requests_needed_uses_cache(self, tmp_path):
+        """Test that skills served from the download cache need no API requests."""
+        def skill(**kwargs):
+            return Skill(name="test", source="github:owner/repo", scope=SkillScope.GLOBAL, **kwargs)
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path)
+        sha = "a" * 40
+
+        assert handler.network_requests_needed(skill()) == 2
+        assert handler.network_requests_needed(skill(ref=sha)) == 1
+
+        (tmp_path / "sha" / sha).mkdir(parents=True)
+        assert handler.network_requests_needed(skill(ref=sha)) == 0
+        assert handler.network_requests_needed(skill(ref="main")) == 1
+
+    def test_network_requests_needed_after_download(self, tmp_path, requests_mock):
+        """Test that the preflight count sees what download() cached, subpaths included."""
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=_build_github_tarball("skills/my-skill")
+        )
+        skill = Skill(
+            name="my-skill",
+            source="github:owner/repo/skills/my-skill",
+            scope=SkillScope.GLOBAL,
+            ref="main"
+        )
+        other = Skill(
+            name="other",
+            source="github:owner/repo/skills/other",
+            scope=SkillScope.GLOBAL,
+            ref="main"
+        )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path)
+        assert handler.network_requests_needed(skill) == 1
+        handler.download(handler.resolve(skill))
+
+        assert handler.network_requests_needed(skill) == 0
+        assert handler.network_requests_needed(other) == 1
+
     def test_unauthorized_error(self, requests_mock):
         """Test handling unauthorized errors."""
         skill = Skill(
@@ -501,12 +978,126 @@ class TestGitHubSourceHandlerEdgeCases:
         with pytest.raises(ValueError, match="Failed to extract"):
             handler.download(resolved)
 
+    def test_download_truncated_tarball(self, tmp_path, requests_mock):
+        """Test handling a gzip stream that ends before its end-of-stream marker."""
+        resolved = ResolvedSource(
+            version="main",
+            commit="main",
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        )
+
+        tar_buffer = io.BytesIO()
+        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
+            skill_content = b"---\nname: test\ndescription: Test\n---\n"
+            skill_info = tarfile.TarInfo(name="repo-main/SKILL.md")
+            skill_info.size = len(skill_content)
+            tar.addfile(skill_info, io.BytesIO(skill_content))
+
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=tar_buffer.getvalue()[:-20]
+        )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        with pytest.raises(ValueError, match="Failed to extract"):
+            handler.download(resolved)
+
+    def test_download_decompression_bomb_rejected(self, tmp_path, requests_mock):
+        """Test that decompression stops once the tar exceeds the size limit."""
+        resolved = ResolvedSource(
+            version="main",
+            commit="main",
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        )
+
+        tar_buffer = io.BytesIO()
+        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
+            info = tarfile.TarInfo(name="repo-main/zeros.bin")
+            info.size = 4 * 1024 * 1024
+            tar.addfile(info, io.BytesIO(b"\0" * info.size))
+
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=tar_buffer.getvalue()
+        )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        handler.MAX_EXTRACT_SIZE = 1024 * 1024
+        handler.MAX_FILE_COUNT = 10
+        with pytest.raises(ValueError, match="tar bomb"):
+            handler.download(resolved)
+        assert list((tmp_path / "cache").glob(".tmp-*")) == []
+
+    def test_download_rejects_tampered_tarball(self, tmp_path, requests_mock):
+        """Test that a corrupted archive fails the gzip integrity check."""
+        resolved = ResolvedSource(
+            version="main",
+            commit="main",
+            download_url="https://api.github.com/repos/owner/repo/tarball/main"
+        )
+
+        tampered = bytearray(_build_github_tarball())
+        tampered[len(tampered) // 2] ^= 0xFF
+        requests_mock.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=bytes(tampered)
+        )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        with pytest.raises(ValueError, match="Failed to extract"):
+            handler.download(resolved)
+        assert list((tmp_path / "cache").glob(".tmp-*")) == []
+
+    def test_download_rejects_archive_of_other_commit(self, tmp_path, requests_mock):
+        """Test that an archive stamped with a different commit is rejected."""
+        expected = "0123456789abcdef0123456789abcdef01234567"
+        actual = "fedcba9876543210fedcba9876543210fedcba98"
+
+        tar_buffer = io.BytesIO()
+        with tarfile.open(
+            fileobj=tar_buffer,
+            mode="w:gz",
+            format=tarfile.PAX_FORMAT,
+            pax_headers={"comment": actual}
+        ) as tar:
+            skill_content = b"---\nname: test\ndescription: Test\n---\n"
+            skill_info = tarfile.TarInfo(name="repo-main/SKILL.md")
+            skill_info.size = len(skill_content)
+            tar.addfile(skill_info, io.BytesIO(skill_content))
+
+        requests_mock.get(
+            f"https://api.github.com/repos/owner/repo/tarball/{expected}",
+            content=tar_buffer.getvalue()
+        )
+        resolved = ResolvedSource(
+            version=expected,
+            commit=expected,
+            download_url=f"https://api.github.com/repos/owner/repo/tarball/{expected}"
+        )
+
+        handler = GitHubSourceHandler(cache_dir=tmp_path / "cache")
+        with pytest.raises(ValueError, match="commit mismatch"):
+            handler.download(resolved)
+        assert not (tmp_path / "cache" / "sha").exists()
+        assert list((tmp_path / "cache").glob(".tmp-*")) == []
+
     def test_default_cache_dir(self):
         """Test that default cache directory is set correctly."""
         handler = GitHubSourceHandler()
         expected = Path.home() / ".cache" / "asma" / "github"
         assert handler.cache_dir == expected
 
+    def test_default_cache_dir_follows_home(self, tmp_path, monkeypatch):
+        """Test that the default cache directory tracks HOME changes."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        handler = GitHubSourceHandler()
+        assert handler.cache_dir == tmp_path / ".cache" / "asma" / "github"
+
+        # The path is built once per home directory and then reused
+        assert GitHubSourceHandler().cache_dir is handler.cache_dir
+        monkeypatch.setenv("HOME", str(tmp_path / "other"))
+        assert GitHubSourceHandler().cache_dir == tmp_path / "other" / ".cache" / "asma" / "github"
+
     def test_custom_cache_dir(self, tmp_path):
         """Test that custom cache directory is used."""
         custom_cache = tmp_path / "my-cache"
@@ -1,25 +1,35 @@
 """Tests for skill installer."""
+import os
 import pytest
 from pathlib import Path
+from unittest.mock import Mock
 from asma.core.installer import SkillInstaller, InstallResult
 from asma.models.skill import Skill, SkillScope
+from asma.core.sources.base import SourceHandler, ResolvedSource
 from asma.core.sources.local import LocalSourceHandler
 
 
+@pytest.fixture
+def mock_local_handler(valid_skill_source):
+    """Return a symlinking handler stub that resolves to the shared valid skill source."""
+    handler = Mock(spec=SourceHandler)
+    handler.resolve.return_value = ResolvedSource(
+        version="0",
+        commit="0",
+        local_path=valid_skill_source
+    )
+    handler.download.return_value = valid_skill_source
+    handler.should_symlink.return_value = True
+    return handler
+
+
 class TestSkillInstaller:
     """Test SkillInstaller class."""
 
-    def test_install_local_skill_with_symlink(self, tmp_path):
+    def test_install_local_skill_with_symlink(self, tmp_path, valid_skill_source):
         """Test installing a local skill creates symlink."""
         # Given: a local skill
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text("""---
-name: test-skill
-description: Test skill
----
-# Test
-""")
+        source_dir = valid_skill_source
 
         skill = Skill(
             name="test-skill",
@@ -44,53 +54,12 @@ description: Test skill
         assert result.skill_name == "test-skill"
         assert result.install_path.exists()
         assert result.install_path.is_symlink()
-        assert result.install_path.resolve() == source_dir.resolve()
-
-    def test_install_skill_with_alias(self, tmp_path):
-        """Test installing skill with alias uses alias as directory name."""
-        # Given: skill with alias
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text("""---
-name: test-skill
-description: Test
----
-# Test
-""")
+        assert os.readlink(result.install_path) == str(source_dir)
 
-        skill = Skill(
-            name="test-skill",
-            source=f"local:{source_dir}",
-            scope=SkillScope.GLOBAL,
-            alias="my-custom-name"
-        )
-
-        install_base = tmp_path / "install"
-        install_base.mkdir()
-
-        # When: we install
-        installer = SkillInstaller()
-        result = installer.install_skill(
-            skill=skill,
-            source_handler=LocalSourceHandler(),
-            install_base=install_base
-        )
-
-        # Then: should use alias
-        assert result.install_path.name == "my-custom-name"
-        assert (install_base / "my-custom-name").exists()
-
-    def test_install_creates_parent_directory(self, tmp_path):
+    def test_install_creates_parent_directory(self, tmp_path, valid_skill_source, mock_local_handler):
         """Test that install creates parent directory if needed."""
         # Given: skill and non-existent install base
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text("""---
-name: test-skill
-description: Test
----
-# Test
-""")
+        source_dir = valid_skill_source
 
         skill = Skill(
             name="test-skill",
@@ -104,7 +73,7 @@ description: Test
         installer = SkillInstaller()
         result = installer.install_skill(
             skill=skill,
-            source_handler=LocalSourceHandler(),
+            source_handler=mock_local_handler,
             install_base=install_base
         )
 
@@ -113,16 +82,10 @@ description: Test
         assert install_base.exists()
         assert result.install_path.exists()
 
-    def test_install_validates_skill(self, tmp_path):
+    def test_install_validates_skill(self, tmp_path, invalid_skill_source):
         """Test that install validates SKILL.md."""
         # Given: skill with invalid SKILL.md (missing description)
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text("""---
-name: test-skill
----
-# Test
-""")
+        source_dir = invalid_skill_source
 
         skill = Skill(
             name="test-skill",
@@ -145,133 +108,72 @@ name: test-skill
         assert result.success is False
         assert "description" in result.error.lower()
 
-    def test_install_overwrites_existing_with_force(self, tmp_path):
-        """Test that force=True overwrites existing installation."""
-        # Given: already installed skill
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text("""---
-name: test-skill
-description: Test
----
-# Test
-""")
-
-        skill = Skill(
-            name="test-skill",
-            source=f"local:{source_dir}",
-            scope=SkillScope.GLOBAL
-        )
-
-        install_base = tmp_path / "install"
-        install_base.mkdir()
-        existing = install_base / "test-skill"
-        existing.mkdir()
-        (existing / "old.txt").write_text("old content")
-
-        # When: we install with force
-        installer = SkillInstaller()
-        result = installer.install_skill(
-            skill=skill,
-            source_handler=LocalSourceHandler(),
-            install_base=install_base,
-            force=True
-        )
-
-        # Then: should overwrite
-        assert result.success is True
-        assert not (existing / "old.txt").exists()
-
-    def test_install_fails_if_exists_without_force(self, tmp_path):
-        """Test that install fails if skill already exists and force=False."""
-        # Given: already installed skill
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text("""---
-name: test-skill
-description: Test
----
-# Test
-""")
-
-        skill = Skill(
-            name="test-skill",
-            source=f"local:{source_dir}",
-            scope=SkillScope.GLOBAL
-        )
-
+    @pytest.mark.parametrize(
+        "preexisting, force, alias, expected_success",
+        [
+            ("none", False, None, True),
+            ("dir", True, None, True),
+            ("dir", False, None, False),
+            ("symlink", True, None, True),
+            ("none", False, "my-custom-name", True),
+        ],
+        ids=[
+            "fresh",
+            "overwrite-dir-with-force",
+            "existing-dir-without-force",
+            "overwrite-symlink-with-force",
+            "alias",
+        ],
+    )
+    def test_install_existing_target(
+        self, tmp_path, valid_skill_source, mock_local_handler,
+        preexisting, force, alias, expected_success
+    ):
+        """Test install against fresh, existing directory, and existing symlink targets."""
+        # Given: an install base, possibly with something already at the target
         install_base = tmp_path / "install"
         install_base.mkdir()
-        (install_base / "test-skill").mkdir()
+        target = install_base / (alias or "test-skill")
 
-        # When: we install without force
-        installer = SkillInstaller()
-        result = installer.install_skill(
-            skill=skill,
-            source_handler=LocalSourceHandler(),
-            install_base=install_base,
-            force=False
-        )
-
-        # Then: should fail
-        assert result.success is False
-        assert "already exists" in result.error.lower()
-
-    def test_install_overwrites_existing_symlink_with_force(self, tmp_path):
-        """Test that force=True can overwrite existing symlink."""
-        # Given: source skill
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text("""---
-name: test-skill
-description: Test
----
-# Test
-""")
-
-        # And: existing symlink
-        install_base = tmp_path / "install"
-        install_base.mkdir()
-        old_source = tmp_path / "old_source"
-        old_source.mkdir()
-        existing_link = install_base / "test-skill"
-        existing_link.symlink_to(old_source, target_is_directory=True)
+        if preexisting == "dir":
+            target.mkdir()
+            (target / "old.txt").write_text("old content")
+        elif preexisting == "symlink":
+            old_source = tmp_path / "old_source"
+            old_source.mkdir()
+            target.symlink_to(old_source, target_is_directory=True)
 
         skill = Skill(
             name="test-skill",
-            source=f"local:{source_dir}",
-            scope=SkillScope.GLOBAL
+            source=f"local:{valid_skill_source}",
+            scope=SkillScope.GLOBAL,
+            alias=alias
         )
 
-        # When: we install with force
+        # When: we install
         installer = SkillInstaller()
         result = installer.install_skill(
             skill=skill,
-            source_handler=LocalSourceHandler(),
+            source_handler=mock_local_handler,
             install_base=install_base,
-            force=True
+            force=force
         )
 
-        # Then: should replace symlink
-        assert result.success is True
-        assert existing_link.is_symlink()
-        assert existing_link.resolve() == source_dir.resolve()
+        # Then: the target is replaced by a symlink to the source, or left alone
+        assert result.success is expected_success
+        assert result.install_path == target
+        if expected_success:
+            assert target.is_symlink()
+            assert os.readlink(target) == str(valid_skill_source)
+            assert not (target / "old.txt").exists()
+        else:
+            assert "already exists" in result.error.lower()
+            assert (target / "old.txt").exists()
 
-    def test_install_with_copy_instead_of_symlink(self, tmp_path):
+    def test_install_with_copy_instead_of_symlink(self, tmp_path, copyable_skill_source):
         """Test installing with a handler that copies instead of symlinks."""
-        from asma.core.sources.base import SourceHandler, ResolvedSource
-        from unittest.mock import Mock
-
         # Given: source skill
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text("""---
-name: test-skill
-description: Test
----
-# Test
-""")
-        (source_dir / "extra.txt").write_text("extra content")
+        source_dir = copyable_skill_source
 
         skill = Skill(
             name="test-skill",
@@ -305,14 +207,10 @@ description: Test
         install_path = install_base / "test-skill"
         assert install_path.exists()
         assert not install_path.is_symlink()  # Not a symlink
-        assert (install_path / "SKILL.md").exists()
-        assert (install_path / "extra.txt").exists()
+        assert set(os.listdir(install_path)) >= {"SKILL.md", "extra.txt"}
 
     def test_install_handles_unexpected_exception(self, tmp_path):
         """Test that installer handles unexpected exceptions gracefully."""
-        from asma.core.sources.base import SourceHandler
-        from unittest.mock import Mock
-
         # Given: a handler that raises an unexpected exception
         skill = Skill(
             name="test-skill",
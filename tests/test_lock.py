@@ -5,23 +5,52 @@ from datetime import datetime
 from asma.models.lock import LockEntry, Lockfile
 from asma.models.skill import SkillScope
 
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def saved_lockfile(tmp_path_factory):
+    """Save a two-entry lockfile once per module and load it back."""
+    lockfile = Lockfile()
+    lockfile.add_entry(LockEntry(
+        name="skill1",
+        scope=SkillScope.GLOBAL,
+        source="github:owner/repo1",
+        resolved_version="v1.0.0",
+        resolved_commit="abc123",
+        installed_at=_NOW,
+        checksum="sha256:test1"
+    ))
+    lockfile.add_entry(LockEntry(
+        name="skill2",
+        scope=SkillScope.PROJECT,
+        source="local:/path/to/skill",
+        resolved_version="local@def456",
+        resolved_commit="def456",
+        installed_at=_NOW,
+        checksum="sha256:test2",
+        symlink=True,
+        resolved_path="/path/to/skill"
+    ))
+
+    lock_path = tmp_path_factory.mktemp("lock") / "skillset.lock"
+    lockfile.save(lock_path)
+    return lockfile, lock_path, Lockfile.load(lock_path)
+
 
 class TestLockEntry:
     """Test LockEntry model."""
 
     def test_create_lock_entry(self):
         """Test creating a lock entry with all fields."""
-        # Given: lock entry data
-        now = datetime.now()
-
-        # When: we create a lock entry
+        # When: we create a lock entry with lock entry data
         entry = LockEntry(
             name="test-skill",
             scope=SkillScope.GLOBAL,
             source="github:owner/repo",
             resolved_version="v1.0.0",
             resolved_commit="abc123def456",
-            installed_at=now,
+            installed_at=_NOW,
             checksum="sha256:test123"
         )
 
@@ -31,7 +60,7 @@ class TestLockEntry:
         assert entry.source == "github:owner/repo"
         assert entry.resolved_version == "v1.0.0"
         assert entry.resolved_commit == "abc123def456"
-        assert entry.installed_at == now
+        assert entry.installed_at == _NOW
         assert entry.checksum == "sha256:test123"
         assert entry.symlink is False
         assert entry.resolved_path is None
@@ -39,14 +68,13 @@ class TestLockEntry:
     def test_lock_entry_to_dict(self):
         """Test converting lock entry to dictionary."""
         # Given: a lock entry
-        now = datetime.now()
         entry = LockEntry(
             name="test-skill",
             scope=SkillScope.GLOBAL,
             source="github:owner/repo",
             resolved_version="v1.0.0",
             resolved_commit="abc123",
-            installed_at=now,
+            installed_at=_NOW,
             checksum="sha256:test",
             symlink=True,
             resolved_path="/path/to/skill"
@@ -59,7 +87,7 @@ class TestLockEntry:
         assert data["source"] == "github:owner/repo"
         assert data["resolved_version"] == "v1.0.0"
         assert data["resolved_commit"] == "abc123"
-        assert data["installed_at"] == now.isoformat()
+        assert data["installed_at"] == _NOW.isoformat()
         assert data["checksum"] == "sha256:test"
         assert data["symlink"] is True
         assert data["resolved_path"] == "/path/to/skill"
@@ -67,12 +95,11 @@ class TestLockEntry:
     def test_lock_entry_from_dict(self):
         """Test creating lock entry from dictionary."""
         # Given: lock entry data as dict
-        now = datetime.now()
         data = {
             "source": "github:owner/repo",
             "resolved_version": "v1.0.0",
             "resolved_commit": "abc123",
-            "installed_at": now.isoformat(),
+            "installed_at": _NOW.isoformat(),
             "checksum": "sha256:test",
             "symlink": True,
             "resolved_path": "/path/to/skill"
@@ -86,7 +113,7 @@ class TestLockEntry:
         assert entry.scope == SkillScope.GLOBAL
         assert entry.source == "github:owner/repo"
         assert entry.resolved_version == "v1.0.0"
-        assert entry.installed_at == now
+        assert entry.installed_at == _NOW
         assert entry.symlink is True
 
 
@@ -113,7 +140,7 @@ class TestLockfile:
             source="github:owner/repo",
             resolved_version="v1.0.0",
             resolved_commit="abc123",
-            installed_at=datetime.now(),
+            installed_at=_NOW,
             checksum="sha256:test"
         )
 
@@ -134,7 +161,7 @@ class TestLockfile:
             source="github:owner/repo",
             resolved_version="v1.0.0",
             resolved_commit="abc123",
-            installed_at=datetime.now(),
+            installed_at=_NOW,
             checksum="sha256:test"
         )
         lockfile.add_entry(entry)
@@ -147,46 +174,29 @@ class TestLockfile:
         assert retrieved.name == "test-skill"
         assert retrieved.resolved_version == "v1.0.0"
 
-    def test_save_and_load_lockfile(self, tmp_path):
-        """Test saving and loading lockfile."""
-        # Given: a lockfile with entries
-        lockfile = Lockfile()
-        entry1 = LockEntry(
-            name="skill1",
-            scope=SkillScope.GLOBAL,
-            source="github:owner/repo1",
-            resolved_version="v1.0.0",
-            resolved_commit="abc123",
-            installed_at=datetime.now(),
-            checksum="sha256:test1"
-        )
-        entry2 = LockEntry(
-            name="skill2",
-            scope=SkillScope.PROJECT,
-            source="local:/path/to/skill",
-            resolved_version="local@def456",
-            resolved_commit="def456",
-            installed_at=datetime.now(),
-            checksum="sha256:test2",
-            symlink=True,
-            resolved_path="/path/to/skill"
-        )
-        lockfile.add_entry(entry1)
-        lockfile.add_entry(entry2)
-
-        lock_path = tmp_path / "skillset.lock"
-
-        # When: we save the lockfile
-        lockfile.save(lock_path)
+    def test_saved_file_exists(self, saved_lockfile):
+        """Test saving a lockfile writes it to disk."""
+        # Given/When: a lockfile saved by the fixture
+        _, lock_path, _ = saved_lockfile
 
         # Then: file should exist
         assert lock_path.exists()
 
-        # When: we load it back
-        loaded = Lockfile.load(lock_path)
+    def test_loaded_has_two_entries(self, saved_lockfile):
+        """Test loading a saved lockfile restores its entries."""
+        # Given/When: a lockfile saved and loaded back by the fixture
+        _, _, loaded = saved_lockfile
 
         # Then: should have same entries
         assert len(loaded.skills) == 2
         assert loaded.get_entry("skill1", SkillScope.GLOBAL) is not None
         assert loaded.get_entry("skill2", SkillScope.PROJECT) is not None
+
+    def test_loaded_preserves_symlink(self, saved_lockfile):
+        """Test loading a saved lockfile preserves the symlink flag."""
+        # Given/When: a lockfile saved and loaded back by the fixture
+        _, _, loaded = saved_lockfile
+
+        # Then: symlink flag should survive the round-trip
+        assert loaded.get_entry("skill1", SkillScope.GLOBAL).symlink is False
         assert loaded.get_entry("skill2", SkillScope.PROJECT).symlink is True
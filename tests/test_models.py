@@ -1,7 +1,53 @@
 """Tests for data models."""
+import re
+from dataclasses import astuple
 import pytest
 from asma.models.skill import Skill, SkillScope
 
+_GLOBAL = SkillScope.GLOBAL
+_PROJECT = SkillScope.PROJECT
+
+_INVALID_NAME_RE = re.compile("Invalid skill name")
+_INVALID_SOURCE_RE = re.compile("Invalid source format")
+_VERSION_REF_RE = re.compile("Cannot specify both version and ref")
+
+_INVALID_NAMES = (
+    "Invalid_Name",  # underscores
+    "UPPERCASE",     # uppercase
+    "has spaces",    # spaces
+    "has@special",   # special chars
+    "trailing\n",    # trailing newline
+    "",              # empty
+)
+
+_VALID_NAMES = (
+    "simple",
+    "with-hyphens",
+    "with123numbers",
+    "a",  # single char
+    "123",  # digits only
+    "very-long-name-with-many-hyphens-123",
+)
+
+_INVALID_SOURCES = (
+    "invalid-format",
+    "http://example.com",
+    "ftp:test/repo",
+    "ftp://example.com",
+    "invalid:source",
+    "github:",  # scheme without location
+    "",
+)
+
+_VALID_SOURCES = (
+    "github:user/repo",
+    "github:user/repo/path/to/skill",
+    "local:/absolute/path",
+    "local:~/home/path",
+    "local:./relative/path",
+    "git:https://example.com/repo.git",
+)
+
 
 class TestSkill:
     """Test Skill data model."""
@@ -13,107 +59,78 @@ class TestSkill:
         skill = Skill(
             name="test-skill",
             source="github:anthropics/skills/test-skill",
-            scope=SkillScope.GLOBAL
+            scope=_GLOBAL
         )
 
-        # Then: skill should be created successfully
-        assert skill.name == "test-skill"
-        assert skill.source == "github:anthropics/skills/test-skill"
-        assert skill.scope == SkillScope.GLOBAL
-        assert skill.version is None
-        assert skill.ref is None
-        assert skill.enabled is True
-        assert skill.alias is None
+        # Then: skill should be created successfully with defaults for the rest
+        # (fields in declaration order: name, source, scope, version, ref, enabled, alias)
+        assert astuple(skill) == (
+            "test-skill",
+            "github:anthropics/skills/test-skill",
+            _GLOBAL,
+            None,
+            None,
+            True,
+            None,
+        )
 
-    def test_skill_name_validation(self):
+    @pytest.mark.parametrize("invalid_name", _INVALID_NAMES)
+    def test_skill_name_validation(self, invalid_name):
         """Test that skill name must follow format rules."""
-        # Given: invalid skill names
-        invalid_names = [
-            "Invalid_Name",  # underscores
-            "UPPERCASE",     # uppercase
-            "has spaces",    # spaces
-            "has@special",   # special chars
-            "",              # empty
-        ]
-
+        # Given: an invalid skill name
         # When/Then: creating skill should raise ValueError
-        for invalid_name in invalid_names:
-            with pytest.raises(ValueError, match="Invalid skill name"):
-                Skill(
-                    name=invalid_name,
-                    source="github:test/repo",
-                    scope=SkillScope.GLOBAL
-                )
-
-    def test_skill_valid_names(self):
-        """Test that valid skill names are accepted."""
-        # Given: valid skill names
-        valid_names = [
-            "simple",
-            "with-hyphens",
-            "with123numbers",
-            "a",  # single char
-            "very-long-name-with-many-hyphens-123",
-        ]
-
-        # When/Then: should create successfully
-        for valid_name in valid_names:
-            skill = Skill(
-                name=valid_name,
+        with pytest.raises(ValueError, match=_INVALID_NAME_RE):
+            Skill(
+                name=invalid_name,
                 source="github:test/repo",
-                scope=SkillScope.GLOBAL
+                scope=_GLOBAL
             )
-            assert skill.name == valid_name
 
-    def test_skill_source_validation(self):
-        """Test that source must have valid format."""
-        # Given: invalid source formats
-        invalid_sources = [
-            "invalid-format",
-            "http://example.com",
-            "ftp:test/repo",
-            "",
-        ]
+    @pytest.mark.parametrize("valid_name", _VALID_NAMES)
+    def test_skill_valid_names(self, valid_name):
+        """Test that valid skill names are accepted."""
+        # Given: a valid skill name
+        # When/Then: should create successfully
+        skill = Skill(
+            name=valid_name,
+            source="github:test/repo",
+            scope=_GLOBAL
+        )
+        assert skill.name == valid_name
 
+    @pytest.mark.parametrize("invalid_source", _INVALID_SOURCES)
+    def test_skill_source_validation(self, invalid_source):
+        """Test that source must have valid format."""
+        # Given: an invalid source format
         # When/Then: should raise ValueError
-        for invalid_source in invalid_sources:
-            with pytest.raises(ValueError, match="Invalid source format"):
-                Skill(
-                    name="test-skill",
-                    source=invalid_source,
-                    scope=SkillScope.GLOBAL
-                )
-
-    def test_skill_valid_sources(self):
-        """Test that valid source formats are accepted."""
-        # Given: valid source formats
-        valid_sources = [
-            "github:user/repo",
-            "github:user/repo/path/to/skill",
-            "local:/absolute/path",
-            "local:~/home/path",
-            "local:./relative/path",
-            "git:https://example.com/repo.git",
-        ]
-
-        # When/Then: should create successfully
-        for valid_source in valid_sources:
-            skill = Skill(
+        with pytest.raises(ValueError, match=_INVALID_SOURCE_RE):
+            Skill(
                 name="test-skill",
-                source=valid_source,
-                scope=SkillScope.GLOBAL
+                source=invalid_source,
+                scope=_GLOBAL
             )
-            assert skill.source == valid_source
+
+    @pytest.mark.parametrize("valid_source", _VALID_SOURCES)
+    def test_skill_valid_sources(self, valid_source):
+        """Test that valid source formats are accepted."""
+        # Given: a valid source format
+        # When/Then: should create successfully
+        skill = Skill(
+            name="test-skill",
+            source=valid_source,
+            scope=_GLOBAL
+        )
+        assert skill.source == valid_source
 
     def test_skill_version_and_ref_mutual_exclusivity(self):
         """Test that both version and ref cannot be specified."""
         # Given: skill with both version and ref
         # When/Then: should raise ValueError
-        with pytest.raises(ValueError, match="Cannot specify both version and ref"):
+        with pytest.raises(ValueError, match=_VERSION_REF_RE):
             Skill(
                 name="test-skill",
                 source="github:test/repo",
-                scope=SkillScope.GLOBAL,
+                scope=_GLOBAL,
                 version="v1.0.0",
                 ref="main"
             )
@@ -124,7 +141,7 @@ class TestSkill:
         skill1 = Skill(
             name="test-skill",
             source="github:test/repo",
-            scope=SkillScope.GLOBAL
+            scope=_GLOBAL
         )
 
         # When/Then: install_name should be name
@@ -134,7 +151,7 @@ class TestSkill:
         skill2 = Skill(
             name="test-skill",
             source="github:test/repo",
-            scope=SkillScope.GLOBAL,
+            scope=_GLOBAL,
             alias="my-custom-name"
         )
 
@@ -149,7 +166,7 @@ class TestSkill:
         skill1 = Skill(
             name="test-skill",
             source="github:test/repo",
-            scope=SkillScope.GLOBAL
+            scope=_GLOBAL
         )
 
         # When/Then: should return global path
@@ -160,7 +177,7 @@ class TestSkill:
         skill2 = Skill(
             name="test-skill",
             source="github:test/repo",
-            scope=SkillScope.PROJECT
+            scope=_PROJECT
         )
 
         # When/Then: should return project path
@@ -171,7 +188,7 @@ class TestSkill:
         skill3 = Skill(
             name="test-skill",
             source="github:test/repo",
-            scope=SkillScope.GLOBAL,
+            scope=_GLOBAL,
             alias="custom"
         )
 
@@ -1,10 +1,14 @@
 """Tests for skill fetcher."""
+import functools
 import io
 import tarfile
 import pytest
+import requests_mock
 from pathlib import Path
 
 from asma.core.skill_fetcher import SkillFetcher, FetchResult
+from asma.core.sources.github import GitHubSourceHandler
+from asma.core.sources.local import LocalSourceHandler
 
 
 class TestFetchResult:
@@ -51,7 +55,6 @@ class TestSkillFetcher:
         fetcher = SkillFetcher()
         handler = fetcher.get_source_handler("local:/path/to/skill")
 
-        from asma.core.sources.local import LocalSourceHandler
         assert isinstance(handler, LocalSourceHandler)
 
     def test_get_source_handler_github(self):
@@ -59,7 +62,6 @@ class TestSkillFetcher:
         fetcher = SkillFetcher(github_token="test-token")
         handler = fetcher.get_source_handler("github:owner/repo")
 
-        from asma.core.sources.github import GitHubSourceHandler
         assert isinstance(handler, GitHubSourceHandler)
 
     def test_get_source_handler_unsupported(self):
@@ -144,20 +146,65 @@ description: A skill without name
         assert "name" in result.error.lower()
 
 
+@pytest.fixture(scope="module")
+def tarball() -> bytes:
+    """Shared tarball for tests that only care about request handling."""
+    return TestSkillFetcherGitHub._create_mock_tarball(b"""---
+name: private-skill
+description: A private skill
+---
+# Private Skill
+""")
+
+
+@pytest.fixture(scope="module")
+def github_api(tarball):
+    """Mock GitHub API with every endpoint these tests use, registered once."""
+    with requests_mock.Mocker() as mocker:
+        mocker.get(
+            "https://api.github.com/repos/owner/repo",
+            json={"default_branch": "main"}
+        )
+        mocker.get(
+            "https://api.github.com/repos/owner/repo/tarball/main",
+            content=TestSkillFetcherGitHub._create_mock_tarball(b"""---
+name: github-skill
+description: A skill from GitHub
+---
+# GitHub Skill
+""")
+        )
+        mocker.get(
+            "https://api.github.com/repos/owner/private-repo",
+            json={"default_branch": "main"}
+        )
+        mocker.get(
+            "https://api.github.com/repos/owner/private-repo/tarball/main",
+            content=tarball
+        )
+        mocker.get(
+            "https://api.github.com/repos/nonexistent/repo",
+            status_code=404,
+            json={"message": "Not Found"}
+        )
+        mocker.get(
+            "https://api.github.com/repos/owner/limited-repo",
+            status_code=403,
+            json={"message": "API rate limit exceeded"}
+        )
+        yield mocker
+
+
 class TestSkillFetcherGitHub:
     """Test SkillFetcher with GitHub sources."""
 
-    def _create_mock_tarball(self, skill_content: bytes) -> bytes:
-        """Create a mock tarball with SKILL.md."""
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _create_mock_tarball(skill_content: bytes) -> bytes:
+        """Create a mock tarball with SKILL.md, built once per distinct content."""
         tar_buffer = io.BytesIO()
         with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
-            # Add directory
-            dir_info = tarfile.TarInfo(name="repo-main/")
-            dir_info.type = tarfile.DIRTYPE
-            dir_info.mode = 0o755
-            tar.addfile(dir_info)
-
-            # Add SKILL.md
+            # Add SKILL.md; extraction creates the repo-main/ root implicitly
             skill_info = tarfile.TarInfo(name="repo-main/SKILL.md")
             skill_info.size = len(skill_content)
             skill_info.mode = 0o644
@@ -165,24 +212,8 @@ class TestSkillFetcherGitHub:
 
         return tar_buffer.getvalue()
 
-    def test_fetch_github_skill(self, requests_mock, tmp_path):
+    def test_fetch_github_skill(self, github_api, tmp_path):
         """Test fetching metadata from GitHub skill."""
-        skill_content = b"""---
-name: github-skill
-description: A skill from GitHub
----
-# GitHub Skill
-"""
-        # Mock GitHub API
-        requests_mock.get(
-            "https://api.github.com/repos/owner/repo",
-            json={"default_branch": "main"}
-        )
-        requests_mock.get(
-            "https://api.github.com/repos/owner/repo/tarball/main",
-            content=self._create_mock_tarball(skill_content)
-        )
-
         fetcher = SkillFetcher(cache_dir=tmp_path / "cache")
         result = fetcher.fetch_metadata("github:owner/repo")
 
@@ -191,57 +222,34 @@ description: A skill from GitHub
         assert result.description == "A skill from GitHub"
         assert result.version == "main"
 
-    def test_fetch_github_skill_with_token(self, requests_mock, tmp_path):
+    def test_fetch_github_skill_with_token(self, github_api, tmp_path):
         """Test fetching with GitHub token."""
-        skill_content = b"""---
-name: private-skill
-description: A private skill
----
-# Private Skill
-"""
-        requests_mock.get(
-            "https://api.github.com/repos/owner/private-repo",
-            json={"default_branch": "main"}
-        )
-        requests_mock.get(
-            "https://api.github.com/repos/owner/private-repo/tarball/main",
-            content=self._create_mock_tarball(skill_content)
-        )
-
         fetcher = SkillFetcher(github_token="test-token", cache_dir=tmp_path / "cache")
         result = fetcher.fetch_metadata("github:owner/private-repo")
 
         assert result.success is True
 
-        # Verify token was used
-        for request in requests_mock.request_history:
-            if "api.github.com" in request.url:
-                assert request.headers.get("Authorization") == "token test-token"
+        # Verify token was used (history is shared across the class)
+        private_requests = [
+            request for request in github_api.request_history
+            if "/repos/owner/private-repo" in request.url
+        ]
+        assert private_requests
+        for request in private_requests:
+            assert request.headers.get("Authorization") == "token test-token"
 
-    def test_fetch_github_skill_not_found(self, requests_mock):
+    def test_fetch_github_skill_not_found(self, github_api):
         """Test fetching from non-existent GitHub repo."""
-        requests_mock.get(
-            "https://api.github.com/repos/nonexistent/repo",
-            status_code=404,
-            json={"message": "Not Found"}
-        )
-
         fetcher = SkillFetcher()
         result = fetcher.fetch_metadata("github:nonexistent/repo")
 
         assert result.success is False
         assert "not found" in result.error.lower()
 
-    def test_fetch_github_rate_limited(self, requests_mock):
+    def test_fetch_github_rate_limited(self, github_api):
         """Test handling GitHub rate limit."""
-        requests_mock.get(
-            "https://api.github.com/repos/owner/repo",
-            status_code=403,
-            json={"message": "API rate limit exceeded"}
-        )
-
         fetcher = SkillFetcher()
-        result = fetcher.fetch_metadata("github:owner/repo")
+        result = fetcher.fetch_metadata("github:owner/limited-repo")
 
         assert result.success is False
         assert "rate limit" in result.error.lower() or "denied" in result.error.lower()
@@ -1,11 +1,25 @@
 """Tests for skillset writer."""
+import os
+import subprocess
+import sys
+
 import pytest
+import yaml
 from pathlib import Path
 
-from asma.core.skillset_writer import SkillsetWriter, SkillEntry
+from asma.core import skillset_writer
+from asma.core.skillset_writer import SkillsetWriter, SkillEntry, _fast_dump, _fast_load
 from asma.models.skill import SkillScope
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Keep the parse cache out of the real ~/.cache/asma."""
+    home = tmp_path / "home"
+    monkeypatch.setenv("HOME", str(home))
+    return home
+
+
 class TestSkillEntry:
     """Test SkillEntry dataclass."""
 
@@ -32,6 +46,15 @@ class TestSkillEntry:
         assert entry.version == "v1.0.0"
         assert entry.ref == "main"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_skill_entry_is_slotted(self):
+        """Test SkillEntry instances carry no per-instance __dict__."""
+        entry = SkillEntry(name="test-skill", source="github:owner/repo")
+
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.extra = "value"
+
 
 class TestSkillsetWriter:
     """Test SkillsetWriter class."""
@@ -278,3 +301,433 @@ project:
         writer = SkillsetWriter(skillset_path)
         assert writer.skill_exists("any-skill", SkillScope.GLOBAL) is False
         assert writer.skill_exists("any-skill", SkillScope.PROJECT) is False
+
+
+_FAST_PATH_DOCUMENTS = [
+    {"global": {}, "project": {}},
+    {
+        "global": {"skill-a": {"source": "github:owner/repo", "version": "v1.0.0"}},
+        "project": {"skill-b": {"source": "local:~/skills/b", "ref": "main"}},
+    },
+    {"global": [{"name": "skill-a", "source": "github:owner/repo/path"}], "project": []},
+    {"global": None, "project": {"skill-b": {"source": "git:https://example.com/r.git"}}},
+]
+
+_FALLBACK_DOCUMENTS = [
+    {"config": {"auto_update": False, "parallel_downloads": 4}, "global": {}, "project": {}},
+    {"global": {"skill-a": {"source": "github:owner/repo", "version": "1.0"}}, "project": {}},
+    {"global": {"skill-a": {"source": "local:/path with spaces"}}, "project": {}},
+    {"global": {"skill-a": {"source": "github:owner/repo", "ref": "yes"}}, "project": {}},
+    {"global": {"skill-a": {"source": "github:owner/repo", "ref": "tag:"}}, "project": {}},
+]
+
+
+class TestSkillsetWriterFastPath:
+    """Test the PyYAML-free read/write path against PyYAML itself."""
+
+    @pytest.mark.parametrize("data", _FAST_PATH_DOCUMENTS + _FALLBACK_DOCUMENTS)
+    def test_save_matches_pyyaml(self, tmp_path, data):
+        """Test saved text is identical to yaml.safe_dump output."""
+        skillset_path = tmp_path / "skillset.yaml"
+        SkillsetWriter(skillset_path).save(data)
+
+        expected = yaml.safe_dump(
+            data, default_flow_style=False, sort_keys=False, allow_unicode=True,
+            width=skillset_writer._NO_WRAP_WIDTH
+        )
+        assert skillset_path.read_text() == expected
+
+    @pytest.mark.parametrize("data", _FAST_PATH_DOCUMENTS + _FALLBACK_DOCUMENTS)
+    def test_round_trip(self, tmp_path, data):
+        """Test load_raw returns what save wrote."""
+        writer = SkillsetWriter(tmp_path / "skillset.yaml")
+        writer.save(data)
+
+        assert writer.load_raw() == {"global": {}, "project": {}, **data}
+
+    @pytest.mark.parametrize("data", _FAST_PATH_DOCUMENTS)
+    def test_fast_path_covers_simple_documents(self, data):
+        """Test documents of plain strings never reach PyYAML."""
+        text = _fast_dump(data)
+
+        assert text is not None
+        assert _fast_load(text) == data
+
+    @pytest.mark.parametrize("data", _FALLBACK_DOCUMENTS)
+    def test_fast_dump_defers_non_strings(self, data):
+        """Test values that need quoting or typing fall back to PyYAML."""
+        assert _fast_dump(data) is None
+
+    @pytest.mark.parametrize("text", [
+        "global:\n  skill-a:\n    source: 'github:owner/repo'\n",
+        "global:\n  skill-a:\n    source: github:owner/repo  # pinned\n",
+        "global:\n  skill-a: {source: github:owner/repo}\n",
+        "---\nglobal: {}\n",
+        "global:\n\tskill-a: {}\n",
+        "global:\n   skill-a: {}\n",
+        "config:\n  auto_update: false\n",
+        "no: {}\n",
+        "global:\n  yes: {}\n",
+        "global:\n  skill-a:\n    on: github:owner/repo\n",
+        "global:\n- null: skill-a\n",
+    ])
+    def test_fast_load_defers_complex_documents(self, text):
+        """Test YAML outside the simple block layout falls back to PyYAML."""
+        assert _fast_load(text) is None
+
+    def test_load_raw_keeps_pyyaml_key_types(self, tmp_path):
+        """Test keys YAML reads as booleans or null are parsed by PyYAML."""
+        text = "global:\n  no: {}\n  Off: {}\nproject:\n  skill-a:\n    null: y\n"
+        skillset_path = tmp_path / "skillset.yaml"
+        skillset_path.write_text(text)
+
+        assert SkillsetWriter(skillset_path).load_raw() == yaml.safe_load(text)
+
+    def test_load_raw_falls_back_to_pyyaml(self, tmp_path):
+        """Test load_raw still parses documents the fast path rejects."""
+        skillset_path = tmp_path / "skillset.yaml"
+        skillset_path.write_text(
+            "global:\n  skill-a:\n    source: \"github:owner/repo\"  # pinned\n"
+        )
+
+        data = SkillsetWriter(skillset_path).load_raw()
+
+        assert data["global"]["skill-a"]["source"] == "github:owner/repo"
+        assert data["project"] == {}
+
+    def test_fast_load_skips_comments_and_blank_lines(self):
+        """Test full-line comments and blank lines are ignored."""
+        text = "# skills\n\nglobal:\n  # pinned\n  skill-a:\n    source: github:o/r\nproject: {}\n"
+
+        assert _fast_load(text) == yaml.safe_load(text)
+
+    def test_long_values_are_not_wrapped(self, tmp_path):
+        """Test long scalars stay on one line."""
+        writer = SkillsetWriter(tmp_path / "skillset.yaml")
+        source = "local:" + "/very long directory name" * 20
+        data = {"global": {"skill-a": {"source": source}}, "project": {}}
+
+        writer.save(data)
+
+        assert len((tmp_path / "skillset.yaml").read_text().splitlines()) == 4
+        writer._invalidate()
+        assert writer.load_raw() == data
+
+    def test_non_ascii_round_trip(self, tmp_path):
+        """Test non-ASCII values are written as UTF-8 and read back intact."""
+        writer = SkillsetWriter(tmp_path / "skillset.yaml")
+        data = {"global": {"skill-a": {"source": "local:~/スキル/a"}}, "project": {}}
+
+        writer.save(data)
+
+        assert "スキル".encode() in (tmp_path / "skillset.yaml").read_bytes()
+        assert writer.load_raw() == data
+
+    def test_fast_path_does_not_import_pyyaml(self, tmp_path):
+        """Test simple skillsets are read and written without importing PyYAML."""
+        skillset_path = tmp_path / "skillset.yaml"
+        script = (
+            "import sys\n"
+            "from asma.core.skillset_writer import SkillsetWriter, SkillEntry\n"
+            "from asma.models.skill import SkillScope\n"
+            f"writer = SkillsetWriter(__import__('pathlib').Path({str(skillset_path)!r}))\n"
+            "writer.add_skill(SkillEntry(name='skill-a', source='github:o/r'), SkillScope.GLOBAL)\n"
+            "writer._invalidate()\n"
+            "assert writer.skill_exists('skill-a', SkillScope.GLOBAL)\n"
+            "assert 'yaml' not in sys.modules, 'PyYAML was imported'\n"
+        )
+
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+
+
+class TestSkillsetWriterCache:
+    """Test load_raw memoization keyed by file mtime and size."""
+
+    @staticmethod
+    def _fail(*args):
+        raise AssertionError("cached work was redone")
+
+    def test_load_after_add_skips_parse(self, tmp_path, monkeypatch):
+        """Test load_raw reuses the data add_skill just wrote."""
+        writer = SkillsetWriter(tmp_path / "skillset.yaml")
+        writer.add_skill(SkillEntry(name="test-skill", source="github:o/r"), SkillScope.GLOBAL)
+
+        monkeypatch.setattr(skillset_writer, "_fast_load", self._fail)
+
+        assert writer.skill_exists("test-skill", SkillScope.GLOBAL) is True
+        assert "test-skill" in writer.load_raw()["global"]
+
+    def test_mutating_result_does_not_touch_cache(self, tmp_path):
+        """Test callers can add and replace skills in the returned sections."""
+        writer = SkillsetWriter(tmp_path / "skillset.yaml")
+        writer.save({"global": {"skill-a": {"source": "github:o/r"}}, "project": []})
+
+        data = writer.load_raw()
+        data["global"]["skill-a"] = {"source": "local:elsewhere"}
+        data["project"].append({"name": "skill-b", "source": "github:o/b"})
+        data["config"] = {}
+
+        assert writer.load_raw() == {
+            "global": {"skill-a": {"source": "github:o/r"}}, "project": [],
+        }
+
+    def test_external_change_is_reloaded(self, tmp_path):
+        """Test a file rewritten behind the writer's back is parsed again."""
+        skillset_path = tmp_path / "skillset.yaml"
+        writer = SkillsetWriter(skillset_path)
+        writer.save({"global": {}, "project": {}})
+        writer.load_raw()
+
+        skillset_path.write_text("global:\n  skill-a:\n    source: github:o/r\nproject: {}\n")
+
+        assert writer.skill_exists("skill-a", SkillScope.GLOBAL) is True
+
+    def test_invalidate_forces_reload(self, tmp_path):
+        """Test _invalidate drops the cache even when mtime and size match."""
+        skillset_path = tmp_path / "skillset.yaml"
+        writer = SkillsetWriter(skillset_path)
+        writer.save({"global": {"skill-a": {}}, "project": {}})
+        st = skillset_path.stat()
+
+        skillset_path.write_text("global:\n  skill-b: {}\nproject: {}\n")
+        os.utime(skillset_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert "skill-a" in writer.load_raw()["global"]
+
+        writer._invalidate()
+
+        assert "skill-b" in writer.load_raw()["global"]
+
+    def test_skill_exists_reuses_name_index(self, tmp_path, monkeypatch):
+        """Test repeated lookups build the name index once per parse."""
+        skillset_path = tmp_path / "skillset.yaml"
+        skillset_path.write_text("global:\n- name: skill-a\n  source: github:o/r\nproject: {}\n")
+        writer = SkillsetWriter(skillset_path)
+        assert writer.skill_exists("skill-a", SkillScope.GLOBAL) is True
+
+        monkeypatch.setattr(skillset_writer, "_index_section", self._fail)
+
+        assert writer.skill_exists("skill-a", SkillScope.GLOBAL) is True
+        assert writer.skill_exists("skill-b", SkillScope.PROJECT) is False
+
+    def test_name_index_tracks_added_skills(self, tmp_path):
+        """Test the name index is rebuilt after add_skill writes the file."""
+        skillset_path = tmp_path / "skillset.yaml"
+        skillset_path.write_text("global:\n- name: skill-a\n  source: github:o/r\nproject: {}\n")
+        writer = SkillsetWriter(skillset_path)
+        assert writer.skill_exists("skill-b", SkillScope.GLOBAL) is False
+
+        writer.add_skill(SkillEntry(name="skill-b", source="github:o/b"), SkillScope.GLOBAL)
+
+        assert writer.skill_exists("skill-b", SkillScope.GLOBAL) is True
+        with pytest.raises(ValueError, match="already exists"):
+            writer.add_skill(SkillEntry(name="skill-a", source="github:o/a"), SkillScope.GLOBAL)
+
+    @pytest.mark.skipif(skillset_writer._orjson is None, reason="orjson not installed")
+    def test_new_writer_reads_json_sidecar(self, tmp_path, monkeypatch, isolated_home):
+        """Test a fresh writer loads the JSON sidecar instead of parsing YAML."""
+        skillset_path = tmp_path / "skillset.yaml"
+        data = {"config": {"auto_update": False}, "global": {"skill-a": {}}, "project": {}}
+        SkillsetWriter(skillset_path).save(data)
+        assert list((isolated_home / ".cache/asma/skillsets").glob("*.json"))
+        assert not (tmp_path / ".skillset.cache.json").exists()
+
+        monkeypatch.setattr(skillset_writer, "_fast_load", self._fail)
+        monkeypatch.setattr(skillset_writer, "_yaml_load", self._fail)
+
+        assert SkillsetWriter(skillset_path).load_raw() == data
+
+    @pytest.mark.skipif(skillset_writer._orjson is None, reason="orjson not installed")
+    def test_stale_json_sidecar_is_ignored(self, tmp_path):
+        """Test the sidecar is not used once skillset.yaml has changed."""
+        skillset_path = tmp_path / "skillset.yaml"
+        SkillsetWriter(skillset_path).save({"global": {}, "project": {}})
+
+        skillset_path.write_text("global:\n  skill-a: {}\nproject: {}\n")
+
+        assert SkillsetWriter(skillset_path).skill_exists("skill-a", SkillScope.GLOBAL) is True
+
+    def test_no_json_sidecar_for_non_json_values(self, tmp_path):
+        """Test data JSON cannot represent exactly is never written to the sidecar."""
+        skillset_path = tmp_path / "skillset.yaml"
+        skillset_path.write_text("config:\n  since: 2024-01-01\nglobal: {}\nproject: {}\n")
+        writer = SkillsetWriter(skillset_path)
+
+        data = writer.load_raw()
+        writer.save(data)
+
+        assert not writer._sidecar_path()[1].exists()
+        assert SkillsetWriter(skillset_path).load_raw() == data
+
+    def test_reads_do_not_write_json_sidecar(self, tmp_path, isolated_home):
+        """Test read-only calls leave the cache directory untouched."""
+        skillset_path = tmp_path / "skillset.yaml"
+        skillset_path.write_text("global:\n  skill-a: {}\nproject: {}\n")
+        writer = SkillsetWriter(skillset_path)
+
+        assert writer.skill_exists("skill-a", SkillScope.GLOBAL) is True
+        writer.load_raw()
+
+        assert not (isolated_home / ".cache").exists()
+
+    @pytest.mark.skipif(skillset_writer._orjson is None, reason="orjson not installed")
+    def test_json_sidecar_is_keyed_by_resolved_path(self, tmp_path, monkeypatch):
+        """Test a sidecar is only used for the skillset file it was written for."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        SkillsetWriter(tmp_path / "a/skillset.yaml").save({"global": {"skill-a": {}}, "project": {}})
+        (tmp_path / "b/skillset.yaml").write_bytes((tmp_path / "a/skillset.yaml").read_bytes())
+        monkeypatch.chdir(tmp_path / "a")
+
+        absolute = SkillsetWriter(tmp_path / "a/skillset.yaml")
+        relative = SkillsetWriter(Path("skillset.yaml"))
+        other = SkillsetWriter(tmp_path / "b/skillset.yaml")
+
+        assert relative._sidecar_path() == absolute._sidecar_path()
+        assert other._sidecar_path()[1] != absolute._sidecar_path()[1]
+
+
+class TestSkillsetWriterBatch:
+    """Test grouping several add_skill calls into one write."""
+
+    def test_batch_writes_once(self, tmp_path, monkeypatch):
+        """Test add_skill inside batch() saves only when the block exits."""
+        writer = SkillsetWriter(tmp_path / "skillset.yaml")
+        saves = []
+        original_save = writer.save
+        monkeypatch.setattr(writer, "save", lambda data: saves.append(original_save(data)))
+
+        with writer.batch():
+            for i in range(3):
+                entry = SkillEntry(name=f"skill-{i}", source="github:o/r")
+                writer.add_skill(entry, SkillScope.GLOBAL)
+            assert saves == []
+            assert writer.skill_exists("skill-2", SkillScope.GLOBAL) is True
+
+        assert len(saves) == 1
+        assert list(SkillsetWriter(tmp_path / "skillset.yaml").load_raw()["global"]) == [
+            "skill-0", "skill-1", "skill-2",
+        ]
+
+    def test_batch_detects_duplicates(self, tmp_path):
+        """Test skills added earlier in a batch count as existing."""
+        skillset_path = tmp_path / "skillset.yaml"
+        skillset_path.write_text("global:\n- name: skill-a\n  source: github:o/a\nproject: {}\n")
+        writer = SkillsetWriter(skillset_path)
+
+        with writer.batch():
+            writer.add_skill(SkillEntry(name="skill-b", source="github:o/b"), SkillScope.GLOBAL)
+            with pytest.raises(ValueError, match="already exists"):
+                writer.add_skill(SkillEntry(name="skill-b", source="github:o/b"), SkillScope.GLOBAL)
+            writer.add_skill(
+                SkillEntry(name="skill-a", source="github:o/a2"), SkillScope.GLOBAL, force=True
+            )
+
+        assert writer.load_raw()["global"] == [
+            {"name": "skill-b", "source": "github:o/b"},
+            {"name": "skill-a", "source": "github:o/a2"},
+        ]
+
+    def test_batch_discards_changes_on_error(self, tmp_path):
+        """Test nothing is written when the batch block raises."""
+        skillset_path = tmp_path / "skillset.yaml"
+        writer = SkillsetWriter(skillset_path)
+
+        with pytest.raises(RuntimeError):
+            with writer.batch():
+                writer.add_skill(SkillEntry(name="skill-a", source="github:o/r"), SkillScope.GLOBAL)
+                raise RuntimeError("abort")
+
+        assert not skillset_path.exists()
+        assert writer.skill_exists("skill-a", SkillScope.GLOBAL) is False
+
+    def test_nested_batch_joins_outer(self, tmp_path):
+        """Test an inner batch defers its write to the outer one."""
+        skillset_path = tmp_path / "skillset.yaml"
+        writer = SkillsetWriter(skillset_path)
+
+        with writer.batch():
+            with writer.batch():
+                entry = SkillEntry(name="skill-a", source="github:o/r")
+                writer.add_skill(entry, SkillScope.PROJECT)
+            assert not skillset_path.exists()
+
+        assert writer.skill_exists("skill-a", SkillScope.PROJECT) is True
+
+
+class TestSkillsetWriterAppendBlock:
+    """Test adding skills by splicing into the existing file text."""
+
+    def test_add_skill_keeps_other_text_verbatim(self, tmp_path):
+        """Test comments and formatting outside the new entry are untouched."""
+        skillset_path = tmp_path / "skillset.yaml"
+        original = (
+            "# My skills\n"
+            "config:\n"
+            "  auto_update: false   # keep pinned\n"
+            "\n"
+            "global:\n"
+            "  skill-a:\n"
+            "    source: 'github:o/a'\n"
+            "\n"
+            "# Project skills\n"
+            "project: {}\n"
+        )
+        skillset_path.write_text(original)
+        writer = SkillsetWriter(skillset_path)
+
+        writer.add_skill(SkillEntry(name="skill-b", source="github:o/b"), SkillScope.GLOBAL)
+        writer.add_skill(SkillEntry(name="skill-c", source="local:~/c"), SkillScope.PROJECT)
+
+        assert skillset_path.read_text() == original.replace(
+            "    source: 'github:o/a'\n",
+            "    source: 'github:o/a'\n  skill-b:\n    source: github:o/b\n",
+        ).replace("project: {}\n", "project:\n  skill-c:\n    source: local:~/c\n")
+        assert SkillsetWriter(skillset_path).load_raw() == writer.load_raw()
+
+    @pytest.mark.parametrize("text", [
+        "global:\n- name: skill-a\n  source: github:o/a\nproject: {}\n",
+        "global:\n    skill-a:\n        source: github:o/a\nproject: {}\n",
+        "global:  # mine\n  skill-a: {}\nproject: {}\n",
+        "global:\n  skill-a:\n    notes: |\n      text\nproject: {}\n",
+        "global: {skill-a: {}}\nproject: {}\n",
+    ])
+    def test_unusual_layouts_fall_back_to_full_rewrite(self, tmp_path, text):
+        """Test layouts the splice does not handle are still updated correctly."""
+        skillset_path = tmp_path / "skillset.yaml"
+        skillset_path.write_text(text)
+        writer = SkillsetWriter(skillset_path)
+        expected = yaml.safe_load(text)
+
+        writer.add_skill(SkillEntry(name="skill-b", source="github:o/b"), SkillScope.GLOBAL)
+
+        data = SkillsetWriter(skillset_path).load_raw()
+        assert data == writer.load_raw()
+        assert writer.skill_exists("skill-a", SkillScope.GLOBAL) is True
+        assert writer.skill_exists("skill-b", SkillScope.GLOBAL) is True
+        assert data["project"] == expected["project"]
+
+    def test_force_overwrite_rewrites_entry(self, tmp_path):
+        """Test replacing an existing skill still goes through a full save."""
+        skillset_path = tmp_path / "skillset.yaml"
+        skillset_path.write_text("global:\n  skill-a:\n    source: github:o/a\nproject: {}\n")
+        writer = SkillsetWriter(skillset_path)
+
+        entry = SkillEntry(name="skill-a", source="github:o/new")
+        writer.add_skill(entry, SkillScope.GLOBAL, force=True)
+
+        assert SkillsetWriter(skillset_path).load_raw()["global"] == {
+            "skill-a": {"source": "github:o/new"},
+        }
+
+    def test_sections_keep_plain_string_keys(self, tmp_path):
+        """Test indexing by SkillScope does not leak enum keys into saved data."""
+        skillset_path = tmp_path / "skillset.yaml"
+        skillset_path.write_text("global:\n- name: skill-a\n  source: github:o/a\nproject: {}\n")
+        writer = SkillsetWriter(skillset_path)
+
+        writer.add_skill(SkillEntry(name="skill-b", source="github:o/b"), SkillScope.GLOBAL)
+
+        assert [type(key) for key in writer.load_raw()] == [str, str]
+        assert skillset_path.read_text().startswith("global:\n- name: skill-a\n")
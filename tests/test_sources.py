@@ -1,6 +1,9 @@
 """Tests for source handlers."""
+import hashlib
+
 import pytest
 from pathlib import Path
+from asma.core.sources import local
 from asma.core.sources.local import LocalSourceHandler
 from asma.core.sources.base import ResolvedSource
 from asma.models.skill import Skill, SkillScope
@@ -150,3 +153,40 @@ description: Test
         handler = LocalSourceHandler()
         with pytest.raises(ValueError, match="must have local_path"):
             handler.download(resolved)
+
+    def test_resolve_reuses_checksum_until_skill_md_changes(self, tmp_path, monkeypatch):
+        """Test that SKILL.md is re-hashed only when its mtime or size changes."""
+        # Given: a local skill that has been resolved once
+        skill_dir = tmp_path / "my-skill"
+        skill_dir.mkdir()
+        skill_md = skill_dir / "SKILL.md"
+        skill_md.write_text("---\nname: test-skill\ndescription: Test\n---\n")
+        skill = Skill(name="test-skill", source=f"local:{skill_dir}", scope=SkillScope.GLOBAL)
+        handler = LocalSourceHandler()
+        first = handler.resolve(skill)
+
+        # When: we resolve again while hashing is unavailable
+        monkeypatch.setattr(local, "_sha256_file", None)
+        second = handler.resolve(skill)
+        monkeypatch.undo()
+
+        # Then: the cached checksum is reused
+        assert second.commit == first.commit
+
+        # When: SKILL.md changes
+        skill_md.write_text("---\nname: test-skill\ndescription: Changed\n---\n")
+        third = handler.resolve(skill)
+
+        # Then: the checksum is recomputed
+        assert third.commit != first.commit
+
+    @pytest.mark.parametrize("size", [0, 100, local._MMAP_THRESHOLD + 1])
+    def test_sha256_file_matches_hashlib(self, tmp_path, size):
+        """Test file hashing agrees with hashlib for small, empty and mapped files."""
+        # Given: a file of the given size
+        data = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+        path = tmp_path / "SKILL.md"
+        path.write_bytes(data)
+
+        # When/Then: the digest matches hashing the bytes directly
+        assert local._sha256_file(str(path), size) == hashlib.sha256(data).hexdigest()
@@ -229,3 +229,138 @@ description: "unterminated string
         # Then: should fail
         assert result.valid is False
         assert any("frontmatter" in error.lower() for error in result.errors)
+
+    def test_validate_stops_reading_after_frontmatter(self, tmp_path):
+        """Test that the markdown body is not read once frontmatter is found."""
+        # Given: SKILL.md with a small frontmatter and a large body
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        skill_md = skill_dir / "SKILL.md"
+        skill_md.write_text(
+            "---\nname: test-skill\ndescription: A test skill\n---\n" + "x" * 1_000_000
+        )
+
+        # When: we read the head and validate
+        head = SkillValidator._read_head(str(skill_md))
+        result = SkillValidator.validate(skill_dir)
+
+        # Then: only the first chunk was read and validation passes
+        assert len(head) < 10_000
+        assert result.valid is True
+        assert result.metadata["name"] == "test-skill"
+
+    def test_validate_frontmatter_spanning_chunks(self, tmp_path):
+        """Test that frontmatter larger than one read is still parsed whole."""
+        # Given: SKILL.md whose frontmatter spans several reads, with CRLF endings
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        skill_md = skill_dir / "SKILL.md"
+        long_description = "word " * 5000
+        skill_md.write_bytes(
+            f"---\r\nname: test-skill\r\ndescription: {long_description}\r\n---\r\n# Body\r\n"
+            .encode()
+        )
+
+        # When: we validate
+        result = SkillValidator.validate(skill_dir)
+
+        # Then: the full description was read
+        assert result.valid is True
+        assert result.metadata["description"] == long_description.strip()
+
+    def test_validate_caches_unchanged_skill(self, tmp_path, monkeypatch):
+        """Test that validating an unchanged skill again does not re-read SKILL.md."""
+        # Given: a skill validated once
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        skill_md = skill_dir / "SKILL.md"
+        skill_md.write_text("---\nname: test-skill\ndescription: A test skill\n---\n")
+        first = SkillValidator.validate(skill_dir)
+        first.errors.append("caller-added error")
+
+        # When: we validate again while reading is unavailable
+        monkeypatch.setattr(SkillValidator, "_read_head", None)
+        second = SkillValidator.validate(skill_dir)
+
+        # Then: the cached result is returned, unaffected by the caller's change
+        assert second.valid is True
+        assert second.errors == []
+        assert second.metadata["name"] == "test-skill"
+
+    def test_validate_revalidates_changed_skill(self, tmp_path):
+        """Test that editing SKILL.md or clearing the cache re-validates it."""
+        # Given: a valid skill validated once
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        skill_md = skill_dir / "SKILL.md"
+        skill_md.write_text("---\nname: test-skill\ndescription: A test skill\n---\n")
+        assert SkillValidator.validate(skill_dir).valid is True
+
+        # When: SKILL.md is edited
+        skill_md.write_text("---\nname: Test_Skill\ndescription: A test skill\n---\n")
+
+        # Then: the new content is validated
+        assert SkillValidator.validate(skill_dir).valid is False
+
+        # And: clear_cache empties the cache
+        SkillValidator.clear_cache()
+        assert SkillValidator._validate_impl.cache_info().currsize == 0
+
+    def test_validate_null_fields_are_not_missing(self, tmp_path):
+        """Test that fields set to null are reported as non-strings, not as missing."""
+        # Given: SKILL.md whose name and description are null
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("---\nname:\ndescription: null\n---\n")
+
+        # When: we validate
+        result = SkillValidator.validate(skill_dir)
+
+        # Then: both fields are reported as having the wrong type
+        assert result.errors == [
+            "SKILL.md field 'name' must be a string",
+            "SKILL.md field 'description' must be a string",
+        ]
+
+    @pytest.mark.parametrize("name, valid", [
+        ("a" * 64, True),
+        ("123", True),
+        ("a" * 65, False),
+        ("my-skill\n", False),
+        ("my_skill", False),
+    ])
+    def test_validate_name_format_edges(self, tmp_path, name, valid):
+        """Test name length limits and characters outside the allowed set."""
+        # Given: SKILL.md with the given name
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: {name!r}\ndescription: A test skill\n---\n".replace("'", '"')
+        )
+
+        # When: we validate
+        result = SkillValidator.validate(skill_dir)
+
+        # Then: only names of 1-64 allowed characters pass
+        assert result.valid is valid
+        assert valid or "Invalid name format" in result.errors[0]
+
+    def test_validate_all_skill_directories(self, tmp_path):
+        """Test that validate_all checks each skill directory under a parent."""
+        # Given: a valid skill, an invalid skill, a hidden directory and a file
+        for name, content in [
+            ("good-skill", "---\nname: good-skill\ndescription: Good\n---\n"),
+            ("bad-skill", "# No frontmatter\n"),
+            (".hidden", "# Ignored\n"),
+        ]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "SKILL.md").write_text(content)
+        (tmp_path / "README.md").write_text("# Skills\n")
+
+        # When: we validate the parent directory
+        results = SkillValidator.validate_all(tmp_path)
+
+        # Then: only skill directories are validated, in name order
+        assert list(results) == ["bad-skill", "good-skill"]
+        assert results["good-skill"].valid is True
+        assert results["bad-skill"].valid is False